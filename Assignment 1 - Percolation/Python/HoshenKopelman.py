@@ -0,0 +1,240 @@
+import sys
+import random
+
+_TOP = 1  # Cluster flag: cluster touches the first row
+_OPEN = bytes.maketrans(b'01', b'\x00\x01')  # Translates a text row of '0'/'1' into 0/1 bytes
+
+
+class HoshenKopelman:
+    def __init__(self, n):
+        """
+        Initializes a streaming percolation checker for grids with n columns.
+
+        Rows are fed one at a time and labelled with the Hoshen-Kopelman algorithm.
+        Only the labels of the last row are kept, so memory is O(n) no matter how
+        many rows the grid has.
+
+        Args:
+            n (int): Number of columns (sites per row).
+        """
+
+        self.n = n
+        self.rows = 0  # Number of rows read so far
+        self.labels = [0] * n  # Cluster labels of the last row (0 represents blocked sites)
+        self.size = {}  # Cluster size per label of the last row
+        self.flags = {}  # _TOP flag per label of the last row
+
+        # Statistics of clusters that no longer reach the last row
+        self.finished = {}  # Cluster size -> number of clusters
+        self.largest = 0
+
+    def addRow(self, row):
+        """
+        Adds the next row of the grid.
+
+        Args:
+            row (sequence[int]): n values, truthy for open sites and 0 for blocked ones
+                (for example a list of ints or a bytes object of 0/1 bytes).
+        """
+
+        n = self.n
+        if len(row) != n:
+            raise ValueError(f"Expected a row of {n} sites, got {len(row)}.")
+
+        prev = self.labels
+        size, flags = self.size, self.flags
+        parent = {label: label for label in size}  # Union-find over the labels of both rows
+
+        def find(label):
+            while parent[label] != label:
+                parent[label] = parent[parent[label]]
+                label = parent[label]
+            return label
+
+        # Label the row: join open sites with their open neighbours above and to the left
+        cur = [0] * n
+        next_label = len(size) + 1
+        first = self.rows == 0
+        for j in range(n):
+            if not row[j]:
+                continue
+
+            up = prev[j]
+            left = cur[j - 1] if j else 0
+            if up and left:
+                a, b = find(up), find(left)
+                if a != b:
+                    if size[a] < size[b]:
+                        a, b = b, a
+                    parent[b] = a
+                    size[a] += size.pop(b)
+                    flags[a] |= flags.pop(b)
+                label = a
+            elif up or left:
+                label = find(up or left)
+            else:
+                label = next_label
+                next_label += 1
+                parent[label] = label
+                size[label] = 0
+                flags[label] = _TOP if first else 0
+
+            cur[j] = label
+            size[label] += 1
+
+        # Clusters of the previous row that do not reach this row are complete
+        live = {find(label) for label in cur if label}
+        for label in {find(label) for label in prev if label} - live:
+            self._finish(size[label])
+
+        # Relabel the row with consecutive labels 1..k so the next row starts compact
+        relabel = {root: k for k, root in enumerate(sorted(live), 1)}
+        self.size = {relabel[root]: size[root] for root in live}
+        self.flags = {relabel[root]: flags[root] for root in live}
+        self.labels = [relabel[find(label)] if label else 0 for label in cur]
+        self.rows += 1
+
+    def addRows(self, rows):
+        """
+        Adds every row produced by an iterable (for example `randomRows` or `readRows`).
+
+        Args:
+            rows (iterable[sequence[int]]): Rows of the grid, top to bottom.
+        """
+
+        for row in rows:
+            self.addRow(row)
+
+    def _finish(self, size):
+        """
+        Records a complete cluster in the statistics.
+
+        Args:
+            size (int): Number of sites in the cluster.
+        """
+
+        self.finished[size] = self.finished.get(size, 0) + 1
+        self.largest = max(self.largest, size)
+
+    def percolates(self):
+        """
+        Checks if the rows read so far percolate (an open path joins the first and last rows).
+
+        Returns:
+            bool: True if some cluster of the last row touches the first row, False otherwise.
+        """
+
+        return any(flag & _TOP for flag in self.flags.values())
+
+    def clusterSizes(self):
+        """
+        Returns the cluster size distribution of the rows read so far.
+
+        Returns:
+            dict[int, int]: Number of clusters of each size.
+        """
+
+        sizes = dict(self.finished)
+        for size in self.size.values():
+            sizes[size] = sizes.get(size, 0) + 1
+        return sizes
+
+    def numberOfClusters(self):
+        """
+        Returns the number of clusters in the rows read so far.
+
+        Returns:
+            int: Number of clusters.
+        """
+
+        return sum(self.finished.values()) + len(self.size)
+
+    def largestCluster(self):
+        """
+        Returns the size of the largest cluster in the rows read so far.
+
+        Returns:
+            int: Number of sites in the largest cluster (0 if there are no open sites).
+        """
+
+        return max(self.largest, max(self.size.values(), default=0))
+
+
+def randomRows(n, p, rows=None, seed=None):
+    """
+    Generates the rows of a random grid on the fly, each site open with probability p.
+
+    Args:
+        n (int): Number of columns.
+        p (float): Site vacancy probability.
+        rows (int | None): Number of rows; defaults to n (a square grid).
+        seed (int | None): Seed for the random number generator.
+
+    Yields:
+        bytes: One row of 0/1 bytes.
+    """
+
+    uniform = random.Random(seed).random
+    for i in range(n if rows is None else rows):
+        yield bytes(uniform() < p for j in range(n))
+
+
+def readRows(path):
+    """
+    Reads the rows of a grid from a text file, one row per line, '1' for open sites
+    and '0' for blocked ones. Lines are read lazily, so the file can be larger than RAM.
+
+    Args:
+        path (str): Path of the grid file.
+
+    Yields:
+        bytes: One row of 0/1 bytes.
+    """
+
+    with open(path, 'rb') as grid:
+        for line in grid:
+            line = line.strip()
+            if line:
+                yield line.translate(_OPEN)
+
+
+def main():
+    """
+    Entry point for the streaming percolation checker.
+
+    Either reads a grid file or generates a random n-by-n grid row by row, then prints
+    whether it percolates and its cluster statistics.
+
+    Usage:
+        python HoshenKopelman.py grid.txt
+        python HoshenKopelman.py n p [seed]
+    """
+
+    args = sys.argv[1:]
+    if len(args) == 1:
+        rows = readRows(args[0])
+        first = next(rows, None)
+        if first is None:
+            raise ValueError("The grid file is empty.")
+        hk = HoshenKopelman(len(first))
+        hk.addRow(first)
+    elif len(args) in (2, 3):
+        n, p = int(args[0]), float(args[1])
+        seed = int(args[2]) if len(args) == 3 else None
+        if n <= 0 or not 0 <= p <= 1:
+            raise ValueError("'n' must be a positive integer, 'p' must be between 0 and 1.")
+        rows = randomRows(n, p, seed=seed)
+        hk = HoshenKopelman(n)
+    else:
+        print('Usage: python HoshenKopelman.py grid.txt | n p [seed]')
+        return
+
+    hk.addRows(rows)
+    print(f"Read {hk.rows} rows of {hk.n} sites")
+    print("percolates              =", hk.percolates())
+    print("clusters                =", hk.numberOfClusters())
+    print("largest cluster         =", hk.largestCluster())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Lattice geometries for `Percolation`.
+
+Sites are numbered with flattened 0-based indices, layer by layer along the
+percolation direction: the first `layer` indices form the top layer and the last
+`layer` indices the bottom layer. Every lattice precomputes, for each position
+inside a layer, a tuple of neighbour offsets, so the neighbours of site p are
+
+    q = p + d  for d in offsets[p % layer]  if 0 <= q < size
+
+The offsets between layers (+/- layer) are always present and fall out of range
+on the first and last layers, so hot loops need no allocation and no bounds
+logic besides that range test. Positions with the same neighbourhood share one
+tuple, so the tables take O(layer) memory.
+"""
+
+
+class Lattice:
+    def __init__(self, shape, offsets):
+        """
+        Initializes a lattice from its shape and per-position neighbour offsets.
+
+        Args:
+            shape (tuple[int, ...]): Number of sites along each axis, percolation axis first.
+            offsets (list[tuple[int, ...]]): Neighbour offsets for each position in a layer.
+        """
+
+        self.shape = shape
+        self.size = 1
+        for length in shape:
+            self.size *= length
+        self.layer = self.size // shape[0]  # Sites per layer (one row in 2D)
+        self.offsets = offsets
+
+    def index(self, *coords):
+        """
+        Calculates the flattened index of a site from its 1-based coordinates.
+
+        Args:
+            *coords (int): One 1-based coordinate per axis, percolation axis first
+                (row, col for 2D lattices).
+
+        Returns:
+            int: The flattened index (0-based) of the site.
+        """
+
+        position = 0
+        for length, coord in zip(self.shape, coords, strict=True):
+            position = position * length + coord - 1
+        return position
+
+    def neighbors(self, position):
+        """
+        Returns the neighbours of a site. Meant for inspection; hot loops should
+        read `offsets` directly.
+
+        Args:
+            position (int): Flattened site index.
+
+        Returns:
+            list[int]: Flattened indices of the neighbouring sites.
+        """
+
+        return [position + d for d in self.offsets[position % self.layer] if 0 <= position + d < self.size]
+
+
+def _share(offsets, cache):
+    """
+    Returns one shared tuple per distinct set of offsets.
+
+    Args:
+        offsets (list[int]): Neighbour offsets of one position, possibly repeated.
+        cache (dict): Tuples created so far.
+
+    Returns:
+        tuple[int, ...]: The offsets, without duplicates or zero, as a shared tuple.
+    """
+
+    key = tuple(sorted(set(offsets) - {0}))
+    return cache.setdefault(key, key)
+
+
+def _axisOffsets(coord, length, stride, periodic):
+    """
+    Returns the offsets to the neighbours of a site along one transverse axis.
+
+    Args:
+        coord (int): 0-based coordinate of the site along the axis.
+        length (int): Number of sites along the axis.
+        stride (int): Index distance between consecutive sites along the axis.
+        periodic (bool): Whether the axis wraps around.
+
+    Returns:
+        list[int]: Offsets to the previous and next sites along the axis, if any.
+    """
+
+    offsets = []
+    if coord > 0:
+        offsets.append(-stride)
+    elif periodic:
+        offsets.append((length - 1) * stride)
+    if coord < length - 1:
+        offsets.append(stride)
+    elif periodic:
+        offsets.append(-(length - 1) * stride)
+    return offsets
+
+
+class RectangularLattice(Lattice):
+    def __init__(self, rows, cols, periodic=False):
+        """
+        Initializes a rows-by-cols square lattice; percolation runs from the first to the last row.
+
+        Args:
+            rows (int): Number of rows.
+            cols (int): Number of columns.
+            periodic (bool): If True, the first and last columns are neighbours.
+        """
+
+        cache = {}
+        offsets = [_share([-cols, cols] + _axisOffsets(col, cols, 1, periodic), cache) for col in range(cols)]
+        super().__init__((rows, cols), offsets)
+
+    def index(self, row, col):
+        """
+        Calculates the flattened index of a site from its 1-based row and column.
+
+        Args:
+            row (int): Row number (1-based index).
+            col (int): Column number (1-based index).
+
+        Returns:
+            int: The flattened index (0-based) of the site.
+        """
+
+        return (row - 1) * self.shape[1] + col - 1
+
+
+class SquareLattice(RectangularLattice):
+    def __init__(self, n):
+        """
+        Initializes the n-by-n square lattice used by `Percolation` by default.
+
+        Args:
+            n (int): Grid size.
+        """
+
+        super().__init__(n, n)
+
+
+class ToroidalLattice(RectangularLattice):
+    def __init__(self, rows, cols):
+        """
+        Initializes a rows-by-cols lattice with periodic boundaries across the columns.
+
+        Only the transverse axis wraps around: wrapping the rows as well would make the
+        top and bottom rows, which percolation connects, neighbours of each other.
+
+        Args:
+            rows (int): Number of rows.
+            cols (int): Number of columns.
+        """
+
+        super().__init__(rows, cols, periodic=True)
+
+
+class CubicLattice(Lattice):
+    def __init__(self, layers, rows=None, cols=None, periodic=False):
+        """
+        Initializes a 3D simple cubic lattice; percolation runs from the first to the last layer.
+
+        Args:
+            layers (int): Number of layers (sites along the percolation axis).
+            rows (int | None): Number of rows per layer; defaults to layers.
+            cols (int | None): Number of columns per layer; defaults to layers.
+            periodic (bool): If True, layers wrap around in both transverse axes.
+        """
+
+        rows = layers if rows is None else rows
+        cols = layers if cols is None else cols
+        layer = rows * cols
+
+        cache = {}
+        offsets = []
+        for row in range(rows):
+            for col in range(cols):
+                site = [-layer, layer] + _axisOffsets(row, rows, cols, periodic) + _axisOffsets(col, cols, 1, periodic)
+                offsets.append(_share(site, cache))
+        super().__init__((layers, rows, cols), offsets)
@@ -1,27 +1,65 @@
-from UnionFind import WeightedQuickUnionUF
+from array import array
+from UnionFind import WeightedQuickUnionUF, instrumented, mergeCounters
+from Lattice import SquareLattice
+
+_TOP = 1  # Root flag: component touches the top row
+_BOTTOM = 2  # Root flag: component touches the bottom row
+
 
 class Percolation:
-    def __init__(self, n):
+    def __init__(self, n, uf_class=WeightedQuickUnionUF, single=False, lattice=None, instrument=False):
         """
         Initializes a Percolation system with an n-by-n grid.
 
         Args:
-            n (int): Grid size.
+            n (int): Grid size. Ignored if a lattice is given.
+            uf_class (type): Union-find implementation to use. Pass
+                `CompactWeightedQuickUnionUF` to store the sites in typed arrays,
+                which allows much larger grids in the same amount of memory.
+            single (bool): If True, use one union-find whose roots carry
+                "touches top" / "touches bottom" flags instead of a second
+                union-find to avoid backwash. Halves memory and union work.
+            lattice (Lattice | None): Geometry of the system, such as
+                `RectangularLattice`, `ToroidalLattice` or `CubicLattice` from the
+                Lattice module. Defaults to the n-by-n `SquareLattice`.
+            instrument (bool): If True, count the union-find work; see `counters()`.
+
+        Pass `RollbackWeightedQuickUnionUF` as uf_class to enable `checkpoint()`
+        and `rollback()`.
         """
 
-        # Create an n-by-n grid with all sites initially blocked (0 represents blocked sites)
-        self.n = n
-        self.grid = [0] * n ** 2
+        if instrument:
+            uf_class = instrumented(uf_class)
+        self.instrument = instrument
+
+        # Create the lattice with all sites initially blocked (0 represents blocked sites)
+        self.lattice = SquareLattice(n) if lattice is None else lattice
+        self.n = n if lattice is None else None
+        self.size = self.lattice.size  # Number of sites
+        self.layer = self.lattice.layer  # Sites in the top (and bottom) layer
+        self.offsets = self.lattice.offsets  # Neighbour offsets per position in a layer
+        self.grid = bytearray(self.size)
+        self.single = single
 
         # Define virtual top and bottom sites for percolation
-        self.top = n ** 2  # Virtual top site
-        self.bottom = n ** 2 + 1  # Virtual bottom site
+        self.top = self.size  # Virtual top site
+        self.bottom = self.size + 1  # Virtual bottom site
 
         # Initialize union-find data structures
-        self.uf = WeightedQuickUnionUF(n ** 2 + 2)  # 2 extra spaces for virtual nodes
-        self.full = WeightedQuickUnionUF(n ** 2 + 2) # To track full sites and avoid backwash
+        if single:
+            self.uf = uf_class(self.size)  # No virtual nodes, the root flags replace them
+            self.full = None
+            self.flags = bytearray(self.size)  # _TOP / _BOTTOM flags, valid at roots only
+            self.percolating = False
+        else:
+            self.uf = uf_class(self.size + 2)  # 2 extra spaces for virtual nodes
+            self.full = uf_class(self.size + 2) # To track full sites and avoid backwash
         self.OpenSites = 0  # Counter for open sites
 
+        # Sites opened so far (with the root flags they replaced in single mode), kept
+        # only when the union-find can roll back, to undo opens in reverse order
+        self.history = [] if hasattr(uf_class, 'rollback') else None
+
 
     def open(self, row, col):
         """
@@ -32,29 +70,200 @@ class Percolation:
             col (int): Column index.
         """
 
-        if not self.isOpen(row, col):
-            position = self.getIndex(row, col)
-            self.grid[position] = 1  # Mark the site as open
-            self.OpenSites += 1  # Update the count of open sites
+        position = self.getIndex(row, col)
+        if not self.grid[position]:
+            self._openIndex(position)
+
+    def open_many(self, rows, cols):
+        """
+        Opens a batch of sites given by parallel sequences of row and column indices.
+
+        Equivalent to calling `open(row, col)` for every pair in order, without the
+        per-call overhead. Accepts lists, `array.array` or NumPy integer arrays.
+        Only for 2D lattices; on 3D lattices, use `open_indices` with `getIndex`.
+
+        Args:
+            rows (sequence[int]): Row indices (1-based).
+            cols (sequence[int]): Column indices (1-based).
+
+        Raises:
+            ValueError: If the lattice is not two-dimensional.
+        """
+
+        if len(self.lattice.shape) != 2:
+            raise ValueError("open_many takes (row, col) pairs; use open_indices on 3D lattices.")
+        if hasattr(rows, 'tolist'):
+            rows = rows.tolist()
+        if hasattr(cols, 'tolist'):
+            cols = cols.tolist()
+
+        cols_per_row = self.layer
+        self.open_indices([(row - 1) * cols_per_row + col - 1 for row, col in zip(rows, cols, strict=True)])
+
+    def open_indices(self, indices):
+        """
+        Opens a batch of sites given by their flattened indices (see `getIndex`).
+
+        Equivalent to opening every site in order, without the per-call overhead.
+        Accepts lists, `array.array` or NumPy integer arrays.
+
+        Args:
+            indices (sequence[int]): Flattened site indices (0-based).
+        """
+
+        if hasattr(indices, 'tolist'):
+            indices = indices.tolist()
+
+        grid = self.grid
+        openIndex = self._openIndex
+        for position in indices:
+            if not grid[position]:
+                openIndex(position)
+
+    def open_until_percolates(self, indices):
+        """
+        Opens sites given by their flattened indices in order, stopping as soon as
+        the system percolates.
+
+        Args:
+            indices (sequence[int]): Flattened site indices (0-based).
+
+        Returns:
+            bool: True if the system percolates, False if the indices ran out first.
+        """
+
+        if hasattr(indices, 'tolist'):
+            indices = indices.tolist()
+
+        grid = self.grid
+        openIndex = self._openIndex
+        percolates = self.percolates
+        for position in indices:
+            if not grid[position]:
+                openIndex(position)
+                if percolates():
+                    return True
+        return percolates()
+
+    def _openIndex(self, position):
+        """
+        Opens a blocked site given by its flattened index and connects it to its
+        open neighbours and, on the first and last rows, to the virtual sites.
+
+        Args:
+            position (int): Flattened index of a blocked site.
+        """
+
+        if self.single:
+            self._openSingle(position)
+            return
+
+        size, layer, grid, uf, full = self.size, self.layer, self.grid, self.uf, self.full
+        grid[position] = 1  # Mark the site as open
+        self.OpenSites += 1  # Update the count of open sites
+        if self.history is not None:
+            self.history.append(position)
+
+        if position < layer:
+            # Connect the top row to the second-to-last element (virtual top site)
+            uf.union(self.top, position)
+            full.union(self.top, position)
+
+        if position >= size - layer:
+            # Connect the lower row to the last element (virtual bottom site)
+            uf.union(self.bottom, position)
+
+        # Check neighboring sites and connect if they are also open
+        for offset in self.offsets[position % layer]:
+            neighbour = position + offset
+            if 0 <= neighbour < size and grid[neighbour]:
+                uf.union(position, neighbour)
+                full.union(position, neighbour)
+
+    def _openSingle(self, position):
+        """
+        Opens a blocked site in single union-find mode.
+
+        The flags of every merged component are combined and stored at the new root,
+        so the root of any component knows whether it touches the top and bottom rows.
+
+        Args:
+            position (int): Flattened index of a blocked site.
+        """
+
+        size, layer, grid, uf, root_flags = self.size, self.layer, self.grid, self.uf, self.flags
+        grid[position] = 1  # Mark the site as open
+        self.OpenSites += 1  # Update the count of open sites
+
+        flags = 0
+        if position < layer:
+            flags |= _TOP
+        if position >= size - layer:
+            flags |= _BOTTOM
+
+        # Merge with open neighbours, collecting their flags
+        for offset in self.offsets[position % layer]:
+            neighbour = position + offset
+            if 0 <= neighbour < size and grid[neighbour]:
+                root_j = uf.root(neighbour)
+                flags |= root_flags[root_j]
+                uf.union(position, root_j)
+
+        root = uf.root(position)
+        if self.history is not None:
+            self.history.append((position, root, root_flags[root]))
+        root_flags[root] |= flags
+        if root_flags[root] == _TOP | _BOTTOM:
+            self.percolating = True
+
+    def checkpoint(self):
+        """
+        Returns a token for the current state, to be passed to `rollback()`.
+
+        Requires a union-find with undo support (`RollbackWeightedQuickUnionUF`).
+
+        Returns:
+            tuple: Opaque token.
+
+        Raises:
+            ValueError: If the union-find cannot roll back.
+        """
+
+        if self.history is None:
+            raise ValueError("checkpoint() requires a union-find with rollback, such as RollbackWeightedQuickUnionUF.")
+
+        full = None if self.single else self.full.checkpoint()
+        percolating = self.percolating if self.single else None
+        return len(self.history), self.uf.checkpoint(), full, percolating
+
+    def rollback(self, token):
+        """
+        Restores the state in which `checkpoint()` returned token, closing every site
+        opened since. Costs O(k log n) for k opens to undo.
 
-            if row == 1:
-                # Connect the top row to the second-to-last element (virtual top site)
-                self.uf.union(self.top, self.getIndex(row, col))
-                self.full.union(self.top, self.getIndex(row, col))
+        Tokens taken after that checkpoint become invalid.
 
-            if row == self.n:
-                # Connect the lower row to the last element (virtual bottom site)
-                self.uf.union(self.bottom, self.getIndex(row, col))
+        Args:
+            token (tuple): Value returned by `checkpoint()`.
+        """
 
-            # Check neighboring sites and connect if they are also open
-            neighbours = [[row - 1, col], [row + 1, col], [row, col - 1], [row, col + 1]]
-            for i, j in neighbours:
-                if 1 <= i <= self.n and 1 <= j <= self.n:
-                    position_j = self.getIndex(i, j)
-                    if self.isOpen(i, j):
-                        self.uf.union(position, position_j)  # Connect neighboring open sites
-                        self.full.union(position, position_j)
+        opened, uf_token, full_token, percolating = token
+        history, grid = self.history, self.grid
+        while len(history) > opened:
+            entry = history.pop()
+            if self.single:
+                position, root, flags = entry
+                self.flags[root] = flags
+            else:
+                position = entry
+            grid[position] = 0
+            self.OpenSites -= 1
 
+        self.uf.rollback(uf_token)
+        if self.single:
+            self.percolating = percolating
+        else:
+            self.full.rollback(full_token)
 
     def isOpen(self, row, col):
         """
@@ -83,8 +292,36 @@ class Percolation:
             bool: True if the site is full, False otherwise.
         """
 
-        position = self.getIndex(row, col)
-        return self.full.root(position) == self.full.root(self.top) and self.isOpen(row, col)
+        return self.is_full_index(self.getIndex(row, col))
+
+    def is_open_index(self, position):
+        """
+        Checks whether a site given by its flattened index is open, on any lattice.
+
+        Args:
+            position (int): Flattened site index (see `Lattice.index`).
+
+        Returns:
+            bool: True if the site is open, False otherwise.
+        """
+
+        return self.grid[position] == 1
+
+    def is_full_index(self, position):
+        """
+        Determines whether a site given by its flattened index is full, on any lattice.
+
+        Args:
+            position (int): Flattened site index (see `Lattice.index`).
+
+        Returns:
+            bool: True if the site is full, False otherwise.
+        """
+
+        if self.single:
+            return self.grid[position] == 1 and self.flags[self.uf.root(position)] & _TOP != 0
+
+        return self.full.root(position) == self.full.root(self.top) and self.grid[position] == 1
 
     def numberOfOpenSites(self):
         """
@@ -106,11 +343,104 @@ class Percolation:
         #if self.n == 1:
         #    return self.isOpen(self.n, self.n)
 
+        if self.single:
+            return self.percolating
+
         return self.uf.root(self.top) == self.uf.root(self.bottom)  # Check if virtual top and bottom are connected
 
+    def counters(self):
+        """
+        Returns the union-find work counters of this system, summed over its
+        union-find structures (see `UnionFind.instrumented`).
+
+        Returns:
+            dict[str, int]: Value of every counter in `UnionFind.COUNTERS`.
+
+        Raises:
+            ValueError: If the system was not created with instrument=True.
+        """
+
+        if not self.instrument:
+            raise ValueError("counters() requires a Percolation created with instrument=True.")
+
+        if self.single:
+            return mergeCounters(self.uf.counters())
+        return mergeCounters(self.uf.counters(), self.full.counters())
+
+    def open_mask(self):
+        """
+        Returns the open state of every site in a single pass.
+
+        Returns:
+            bytearray: One byte per site, indexed by flattened site index, 1 for open sites.
+        """
+
+        return bytearray(self.grid)
+
+    def full_mask(self):
+        """
+        Returns the full state of every site in a single pass, equivalent to calling
+        `isFull()` on each site but with one root walk per open site.
+
+        Returns:
+            bytearray: One byte per site, indexed by flattened site index, 1 for full sites.
+        """
+
+        grid = self.grid
+        mask = bytearray(len(grid))
+        single, root_flags = self.single, self.flags if self.single else None
+        uf = self.uf if single else self.full
+        id = uf.id
+        top = None if single else uf.root(self.top)
+
+        for position in range(len(grid)):
+            if grid[position]:
+                root = position
+                while id[root] != root:
+                    root = id[root]
+                mask[position] = root_flags[root] & _TOP != 0 if single else root == top
+        return mask
+
+    def component_labels(self):
+        """
+        Labels the open clusters of the grid in a single raster pass.
+
+        Clusters are numbered 0, 1, 2, ... in order of their first site. Only the
+        grid itself is used, so clusters joined through the virtual top or bottom
+        sites keep separate labels.
+
+        Returns:
+            array: One C int per site, indexed by flattened site index, -1 for blocked sites.
+        """
+
+        size, layer, offsets, grid = self.size, self.layer, self.offsets, self.grid
+        parent = array('i', range(size))  # Site-indexed union-find over open clusters
+
+        def root(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # Join every open site with its open neighbours that come earlier in the raster order
+        for position in range(size):
+            if grid[position]:
+                for offset in offsets[position % layer]:
+                    neighbour = position + offset
+                    if 0 <= neighbour < position and grid[neighbour]:
+                        parent[root(position)] = root(neighbour)
+
+        labels = array('i', [-1]) * len(grid)
+        compact = {}
+        for position in range(len(grid)):
+            if grid[position]:
+                labels[position] = compact.setdefault(root(position), len(compact))
+        return labels
+
     def getIndex(self, row, col):
         """
         Calculates the index corresponding to a given row and column in a flattened grid.
+        Use `lattice.index()` for lattices with more than two axes.
 
         Args:
             row (int): Row number (1-based index).
@@ -120,4 +450,4 @@ class Percolation:
             int: The flattened index corresponding to the specified row and column.
         """
 
-        return (row - 1) * self.n + col - 1
+        return self.lattice.index(row, col)
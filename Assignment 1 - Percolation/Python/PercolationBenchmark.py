@@ -0,0 +1,294 @@
+import sys
+import json
+import time
+import random
+import platform
+import tracemalloc
+import multiprocessing
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from Percolation import Percolation
+from PercolationStats import PercolationStats
+from UnionFind import WeightedQuickUnionUF, CompactWeightedQuickUnionUF
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then reported as None
+    resource = None
+
+# Percolation configurations compared by the benchmark: (label, uf_class, single)
+CONFIGURATIONS = [
+    ("two UF (list)", WeightedQuickUnionUF, False),
+    ("single UF + flags (list)", WeightedQuickUnionUF, True),
+    ("two UF (compact)", CompactWeightedQuickUnionUF, False),
+    ("single UF + flags (compact)", CompactWeightedQuickUnionUF, True),
+]
+
+# Default grid of the benchmark suite
+SUITE_N = [64, 128, 256]
+SUITE_TRIALS = [10, 100]
+REGRESSION_TOLERANCE = 0.10  # Slowdown against the baseline reported as a regression
+
+
+def runUntilPercolates(n, sites, uf_class, single):
+    """
+    Opens the given sites in order until the system percolates.
+
+    Args:
+        n (int): Grid size.
+        sites (list[tuple[int, int]]): (row, col) pairs to open, in order.
+        uf_class (type): Union-find implementation passed to Percolation.
+        single (bool): Whether to use the single union-find mode.
+
+    Returns:
+        Percolation: The percolating system.
+    """
+
+    p = Percolation(n, uf_class, single)
+    for row, col in sites:
+        p.open(row, col)
+        if p.percolates():
+            break
+    return p
+
+
+def benchmark(n, seed=0):
+    """
+    Measures time and peak memory of every configuration on the same site sequence.
+
+    Time and memory are measured in separate runs, since tracing allocations
+    slows the run down considerably.
+
+    Args:
+        n (int): Grid size.
+        seed (int): Seed for the random opening order.
+
+    Returns:
+        list[tuple[str, float, int]]: (label, seconds, peak bytes) per configuration.
+    """
+
+    sites = [(row, col) for row in range(1, n + 1) for col in range(1, n + 1)]
+    random.Random(seed).shuffle(sites)
+
+    results = []
+    for label, uf_class, single in CONFIGURATIONS:
+        start = time.perf_counter()
+        runUntilPercolates(n, sites, uf_class, single)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        runUntilPercolates(n, sites, uf_class, single)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results.append((label, seconds, peak))
+    return results
+
+
+def peakRSS():
+    """
+    Returns the peak resident set size of the current process.
+
+    Returns:
+        int | None: Peak RSS in bytes, or None where the `resource` module is unavailable.
+    """
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports kilobytes
+
+
+def runCase(case):
+    """
+    Runs one benchmark case. Meant to run in a fresh process, so that the peak
+    RSS belongs to this case alone.
+
+    Args:
+        case (dict): "kind" ("percolation" or "stats"), "n", "seed" and, depending on
+            the kind, "configuration" (a CONFIGURATIONS label) or "trials".
+
+    Returns:
+        dict: The case with "seconds", "opens", "opens_per_second" and "peak_rss" added.
+    """
+
+    n, seed = case["n"], case["seed"]
+    start = time.perf_counter()
+    if case["kind"] == "percolation":
+        uf_class, single = {label: (uf, single) for label, uf, single in CONFIGURATIONS}[case["configuration"]]
+        sites = [(row, col) for row in range(1, n + 1) for col in range(1, n + 1)]
+        random.Random(seed).shuffle(sites)
+        start = time.perf_counter()
+        opens = runUntilPercolates(n, sites, uf_class, single).numberOfOpenSites()
+    else:
+        opens = sum(PercolationStats(n, case["trials"], seed=seed).thresholds)
+    seconds = time.perf_counter() - start
+
+    return dict(case, seconds=seconds, opens=opens, opens_per_second=opens / seconds, peak_rss=peakRSS())
+
+
+def suiteCases(ns=SUITE_N, trials=SUITE_TRIALS, seed=0):
+    """
+    Lists the cases of the benchmark suite: every Percolation configuration for every
+    n, and PercolationStats for every combination of n and T.
+
+    Args:
+        ns (list[int]): Grid sizes.
+        trials (list[int]): Trial counts for PercolationStats.
+        seed (int): Seed shared by all cases.
+
+    Returns:
+        list[dict]: Cases to pass to `runCase`.
+    """
+
+    cases = [{"kind": "percolation", "configuration": label, "n": n, "seed": seed}
+             for n in ns for label, uf_class, single in CONFIGURATIONS]
+    cases += [{"kind": "stats", "n": n, "trials": t, "seed": seed} for n in ns for t in trials]
+    return cases
+
+
+def runSuite(cases):
+    """
+    Runs every case in its own freshly spawned process.
+
+    Args:
+        cases (list[dict]): Cases from `suiteCases`.
+
+    Returns:
+        dict: JSON-serializable report with the environment and one result per case.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for case in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.append(executor.submit(runCase, case).result())
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def caseKey(result):
+    """
+    Identifies a case independently of its measurements, to match it against a baseline.
+
+    Args:
+        result (dict): A case or a result of `runCase`.
+
+    Returns:
+        tuple: The parameters of the case.
+    """
+
+    return result["kind"], result.get("configuration"), result["n"], result.get("trials"), result["seed"]
+
+
+def compare(report, baseline, tolerance=REGRESSION_TOLERANCE):
+    """
+    Compares a report against a stored baseline report, case by case.
+
+    Args:
+        report (dict): Report from `runSuite`.
+        baseline (dict): Earlier report from `runSuite`.
+        tolerance (float): Relative slowdown above which a case counts as a regression.
+
+    Returns:
+        tuple[list[tuple[dict, float]], list[dict]]: Every case present in both reports
+        with its time ratio (current / baseline), and the regressed cases.
+    """
+
+    previous = {caseKey(result): result for result in baseline["results"]}
+    ratios, regressions = [], []
+    for result in report["results"]:
+        if caseKey(result) in previous:
+            ratio = result["seconds"] / previous[caseKey(result)]["seconds"]
+            ratios.append((result, ratio))
+            if ratio > 1 + tolerance:
+                regressions.append(result)
+    return ratios, regressions
+
+
+def describe(result):
+    """
+    Returns a short human-readable name of a case.
+
+    Args:
+        result (dict): A case or a result of `runCase`.
+
+    Returns:
+        str: The case name.
+    """
+
+    if result["kind"] == "percolation":
+        return f"Percolation n={result['n']} {result['configuration']}"
+    return f"PercolationStats n={result['n']} T={result['trials']}"
+
+
+def suiteMain(args):
+    """
+    Runs the benchmark suite, writes the JSON report and compares it with a baseline.
+
+    Args:
+        args (list[str]): output.json [baseline.json]
+
+    Returns:
+        int: Exit status, 1 if a case regressed against the baseline.
+    """
+
+    report = runSuite(suiteCases())
+    with open(args[0], "w") as output:
+        json.dump(report, output, indent=2)
+
+    print(f"{'case':<55}{'time (s)':>10}{'opens/s':>14}{'peak RSS (MB)':>16}")
+    for result in report["results"]:
+        rss = "n/a" if result["peak_rss"] is None else f"{result['peak_rss'] / 2 ** 20:.1f}"
+        print(f"{describe(result):<55}{result['seconds']:>10.3f}{result['opens_per_second']:>14.0f}{rss:>16}")
+
+    if len(args) == 2:
+        with open(args[1]) as stored:
+            ratios, regressions = compare(report, json.load(stored))
+        print(f"\nAgainst baseline {args[1]}:")
+        for result, ratio in ratios:
+            print(f"{describe(result):<55}{ratio:>10.2f}x")
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than the baseline by more than {REGRESSION_TOLERANCE:.0%}")
+            return 1
+    return 0
+
+
+def main():
+    """
+    Entry point for the Percolation benchmark script.
+
+    Usage:
+        python PercolationBenchmark.py n [seed]
+        python PercolationBenchmark.py suite output.json [baseline.json]
+    """
+
+    args = sys.argv[1:]
+    if args and args[0] == "suite":
+        if len(args) not in (2, 3):
+            print('Usage: python PercolationBenchmark.py suite output.json [baseline.json]')
+            return
+        sys.exit(suiteMain(args[1:]))
+
+    if len(args) not in (1, 2):
+        print('Usage: python PercolationBenchmark.py n [seed] | suite output.json [baseline.json]')
+        return
+
+    n = int(args[0])
+    seed = int(args[1]) if len(args) == 2 else 0
+    if n <= 0:
+        raise ValueError("'n' must be a positive integer.")
+
+    print(f"Received n = {n}, seed = {seed}")
+    print(f"{'configuration':<30}{'time (s)':>12}{'peak memory (MB)':>20}")
+    for label, seconds, peak in benchmark(n, seed):
+        print(f"{label:<30}{seconds:>12.3f}{peak / 2 ** 20:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
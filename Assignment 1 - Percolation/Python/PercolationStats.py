@@ -1,39 +1,279 @@
 import sys
+import math
 import random
 import statistics
+from itertools import repeat, islice
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
 from Percolation import Percolation
+from UnionFind import mergeCounters
+
+
+SITE_BLOCK = 4096  # Number of candidate sites produced per block
+
+
+def uniformSites(n, seed, block=SITE_BLOCK):
+    """
+    Generates uniformly random sites with replacement, in blocks.
+
+    Draws that hit an already open site are wasted, as in the original
+    random.randint experiment, but every block is drawn with a single call.
+
+    Args:
+        n (int): Grid size.
+        seed (int): Seed for the random number generator.
+        block (int): Number of sites per block.
+
+    Yields:
+        list[int]: Flattened site indices.
+    """
+
+    rng = random.Random(seed)
+    sites = range(n ** 2)
+    while True:
+        yield rng.choices(sites, k=block)
+
+
+def permutationSites(n, seed, block=SITE_BLOCK):
+    """
+    Generates the sites of a random permutation, in blocks (Newman-Ziff sweep).
+
+    Every site is produced exactly once, so no draw is wasted. The permutation is
+    built lazily with Fisher-Yates steps, one block at a time, so a trial that
+    percolates early never pays for shuffling the rest of the grid.
+
+    Args:
+        n (int): Grid size.
+        seed (int): Seed for the random number generator.
+        block (int): Number of sites per block.
+
+    Yields:
+        list[int]: Flattened site indices.
+    """
+
+    uniform = random.Random(seed).random
+    sites = n ** 2
+    order = list(range(sites))
+    for start in range(0, sites, block):
+        end = min(start + block, sites)
+        for i in range(start, end):
+            j = i + int(uniform() * (sites - i))  # Uniform in [i, sites); bias < sites / 2**53
+            order[i], order[j] = order[j], order[i]
+        yield order[start:end]
+
+
+def numpyPermutationSites(n, seed, block=SITE_BLOCK * 16):
+    """
+    Generates the sites of a random permutation with a NumPy `Generator`, in blocks.
+
+    The whole permutation is drawn in one vectorized call, so there are no per-site
+    Python RNG calls at all. Requires NumPy.
+
+    Args:
+        n (int): Grid size.
+        seed (int): Seed for `numpy.random.default_rng`.
+        block (int): Number of sites per block.
+
+    Yields:
+        numpy.ndarray: Flattened site indices.
+    """
+
+    import numpy
+
+    order = numpy.random.default_rng(seed).permutation(n ** 2)
+    for start in range(0, n ** 2, block):
+        yield order[start:start + block]
+
+
+def blockTrial(n, sites, seed, instrument=False):
+    """
+    Runs one experiment, opening candidate sites block by block until the system percolates.
+
+    With a permutation generator (Newman-Ziff sweep) the system percolates after k
+    opens exactly for k >= the returned value, so the return value alone describes
+    the whole spanning curve of the trial.
+
+    Args:
+        n (int): Grid size.
+        sites (callable): Site generator, called as `sites(n, seed)` and returning
+            an iterable of blocks of flattened site indices.
+        seed (int): Seed passed to the site generator.
+        instrument (bool): Whether to count the union-find work.
+
+    Returns:
+        tuple[int, dict | None]: Number of open sites when the system first percolates,
+        and the union-find counters if instrumented.
+    """
+
+    p = Percolation(n, single=True, instrument=instrument)
+    for block in sites(n, seed):
+        if p.open_until_percolates(block):
+            break
+    return p.numberOfOpenSites(), p.counters() if instrument else None
+
+
+ENGINES = {"sweep": permutationSites, "randint": uniformSites, "numpy": numpyPermutationSites}
+
+
+CONFIDENCE_95 = 1.96
+MIN_ADAPTIVE_TRIALS = 10  # Trials run before the adaptive stopping rule is checked
+
+
+def trialSeeds(seed):
+    """
+    Derives one independent seed per trial from a master seed.
+
+    The seeds depend only on the master seed and the trial number, so an experiment
+    is reproducible regardless of how its trials are spread over worker processes.
+
+    Args:
+        seed (int | None): Master seed; None draws one from the operating system.
+
+    Yields:
+        int: A 64-bit seed for every trial, in trial order.
+    """
+
+    master = random.Random(seed)
+    while True:
+        yield master.getrandbits(64)
+
+
+def runTrial(sites, n, seed, instrument=False):
+    """
+    Runs a single trial with its own seed.
+
+    Defined at module level so that it can be sent to worker processes.
+
+    Args:
+        sites (callable): Site generator, one of the ENGINES values or a custom one.
+        n (int): Grid size.
+        seed (int): Seed for this trial.
+        instrument (bool): Whether to count the union-find work.
+
+    Returns:
+        tuple[int, dict | None]: See `blockTrial`.
+    """
+
+    return blockTrial(n, sites, seed, instrument)
+
 
 class PercolationStats:
-    def __init__(self, n, trials):
+    def __init__(self, n, trials, engine="sweep", workers=1, seed=None, halfwidth=None, instrument=False):
         """
         Initializes a PercolationStats object.
 
         Args:
             n (int): The grid size for percolation experiments.
-            trials (int): The number of independent trials.
+            trials (int): The number of independent trials. In adaptive mode, the
+                maximum number of trials.
+            engine (str | callable): Site generator of the trials: "sweep" (Newman-Ziff,
+                one random permutation per trial), "randint" (random sites with replacement),
+                "numpy" (permutation drawn by NumPy), or a callable `sites(n, seed)` returning
+                blocks of flattened site indices. Custom callables must be picklable
+                (module-level) when workers > 1.
+            workers (int): Number of worker processes to spread the trials over.
+            seed (int | None): Master seed. Every trial gets its own seed derived from it,
+                so results are reproducible for any number of workers.
+            halfwidth (float | None): Target half-width of the 95% confidence interval.
+                If given, trials are run until the interval is at least this narrow
+                (or `trials` is reached); see `trialsUsed()`.
+            instrument (bool): If True, count the union-find work of every trial;
+                see `counters()`.
 
         Raises:
-            ValueError: If n or trials is not a positive integer.
+            ValueError: If n or trials is not a positive integer, or engine is unknown.
         """
 
-        self.n = n
-        results = []
+        if not callable(engine) and engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {sorted(ENGINES)}.")
+        if halfwidth is not None and halfwidth <= 0:
+            raise ValueError("'halfwidth' must be positive.")
 
-        # Perform independent trials
-        for i in range(trials):
-            self.p = Percolation(n)
+        self.n = n
+        sites = engine if callable(engine) else ENGINES[engine]
 
-            while not self.p.percolates():
-                row, col = random.randint(1, n), random.randint(1, n)  # Get random positions to open
-                self.p.open(row, col)
-            results.append(self.p.numberOfOpenSites() / (n ** 2))
+        # Perform independent trials, recording the open-site count at which each percolated
+        seeds = trialSeeds(seed)
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+        with executor:
+            if halfwidth is None:
+                chunksize = max(1, trials // (workers * 4))
+                outcomes = self._mapTrials(executor, sites, n, islice(seeds, trials), instrument, chunksize)
+            else:
+                outcomes = self._runAdaptive(executor, sites, n, seeds, trials, halfwidth, workers, instrument)
+        self.thresholds = [k for k, counters in outcomes]
+        self.trialCounters = [counters for k, counters in outcomes] if instrument else None
+        results = [k / (n ** 2) for k in self.thresholds]
+        trials = len(results)
 
         # Compute statistics
-        confidence_95 = 1.96
         self.mean_value = statistics.mean(results)
         self.stddev_value = statistics.stdev(results)
-        self.confidenceLo_value = self.mean_value - confidence_95 * self.stddev_value / (trials ** (1 / 2))
-        self.confidenceHi_value = self.mean_value + confidence_95 * self.stddev_value / (trials ** (1 / 2))
+        self.confidenceLo_value = self.mean_value - CONFIDENCE_95 * self.stddev_value / (trials ** (1 / 2))
+        self.confidenceHi_value = self.mean_value + CONFIDENCE_95 * self.stddev_value / (trials ** (1 / 2))
+
+    @staticmethod
+    def _mapTrials(executor, sites, n, seeds, instrument, chunksize=1):
+        """
+        Runs one trial per seed, on the process pool if there is one.
+
+        Args:
+            executor (ProcessPoolExecutor | nullcontext): Pool to run the trials on.
+            sites (callable): Site generator of the trials.
+            n (int): Grid size.
+            seeds (iterable[int]): Seeds of the trials to run.
+            instrument (bool): Whether to count the union-find work.
+            chunksize (int): Number of trials sent to a worker at a time.
+
+        Returns:
+            list[tuple[int, dict | None]]: The result of every trial, in seed order.
+        """
+
+        if isinstance(executor, ProcessPoolExecutor):
+            return list(executor.map(runTrial, repeat(sites), repeat(n), seeds, repeat(instrument), chunksize=chunksize))
+        return [runTrial(sites, n, trial_seed, instrument) for trial_seed in seeds]
+
+    def _runAdaptive(self, executor, sites, n, seeds, max_trials, halfwidth, workers, instrument):
+        """
+        Runs trials until the 95% confidence interval is narrow enough.
+
+        Mean and variance are updated incrementally (Welford's algorithm) and the
+        stopping rule is checked after every trial in trial order. Trials are run
+        in batches to keep the workers busy; results past the stopping point are
+        discarded, so the trials used do not depend on the number of workers.
+
+        Args:
+            executor (ProcessPoolExecutor | nullcontext): Pool to run the trials on.
+            sites (callable): Site generator of the trials.
+            n (int): Grid size.
+            seeds (iterator[int]): Per-trial seeds.
+            max_trials (int): Upper bound on the number of trials.
+            halfwidth (float): Target half-width of the confidence interval.
+            workers (int): Number of worker processes.
+            instrument (bool): Whether to count the union-find work.
+
+        Returns:
+            list[tuple[int, dict | None]]: The result of every trial used.
+        """
+
+        batch = workers * 4 if workers > 1 else 1
+        outcomes = []
+        count, mean, m2 = 0, 0.0, 0.0
+
+        while count < max_trials:
+            batch_seeds = list(islice(seeds, min(batch, max_trials - count)))
+            for outcome in self._mapTrials(executor, sites, n, batch_seeds, instrument):
+                outcomes.append(outcome)
+                x = outcome[0] / (n ** 2)
+                count += 1
+                delta = x - mean
+                mean += delta / count
+                m2 += delta * (x - mean)
+
+                if count >= MIN_ADAPTIVE_TRIALS and CONFIDENCE_95 * (m2 / (count - 1) / count) ** (1 / 2) <= halfwidth:
+                    return outcomes
+
+        return outcomes
 
     def mean(self):
         """
@@ -63,16 +303,94 @@ class PercolationStats:
 
         return self.confidenceHi_value
 
+    def trialsUsed(self):
+        """
+        Returns the number of trials the statistics are based on.
+        """
+
+        return len(self.thresholds)
+
+    def counters(self):
+        """
+        Returns the union-find work counters rolled up over all trials
+        (see `Percolation.counters`); per-trial values are in `trialCounters`.
+
+        Returns:
+            dict[str, int]: Totals of every counter, and the maximum `max_height`.
+
+        Raises:
+            ValueError: If the statistics were not computed with instrument=True.
+        """
+
+        if self.trialCounters is None:
+            raise ValueError("counters() requires PercolationStats created with instrument=True.")
+
+        return mergeCounters(*self.trialCounters)
+
+    def spanningCurve(self):
+        """
+        Returns the spanning curve over the number of open sites (microcanonical ensemble).
+
+        Returns:
+            list[float]: Entry k is the fraction of trials that percolate once k sites are open,
+            for k = 0..n^2.
+        """
+
+        sites = self.n ** 2
+        counts = [0] * (sites + 1)
+        for k in self.thresholds:
+            counts[k] += 1
+
+        curve = []
+        percolating = 0
+        for k in range(sites + 1):
+            percolating += counts[k]
+            curve.append(percolating / len(self.thresholds))
+        return curve
+
+    def spanningProbability(self, p):
+        """
+        Returns the probability that the system percolates when each site is open
+        with probability p (canonical ensemble).
+
+        The spanning curve is convolved with the binomial distribution of the number
+        of open sites, so any p can be evaluated without running new experiments.
+
+        Args:
+            p (float): Site vacancy probability, between 0 and 1.
+
+        Returns:
+            float: Estimated spanning probability at p.
+        """
+
+        if not 0 <= p <= 1:
+            raise ValueError("'p' must be between 0 and 1.")
+
+        curve = self.spanningCurve()
+        sites = self.n ** 2
+        if p == 0 or p == 1:
+            return curve[round(p * sites)]
+
+        log_p, log_q = math.log(p), math.log1p(-p)
+        log_norm = math.lgamma(sites + 1)
+        total = 0.0
+        for k in range(sites + 1):
+            if curve[k]:
+                log_weight = log_norm - math.lgamma(k + 1) - math.lgamma(sites - k + 1) + k * log_p + (sites - k) * log_q
+                total += curve[k] * math.exp(log_weight)
+        return total
+
 
 def main():
     """
     Entry point for the PercolationStats script.
 
-    Reads command-line arguments for grid size (n) and number of trials (T).
+    Reads command-line arguments for grid size (n), number of trials (T) and,
+    optionally, the number of worker processes.
     Computes percolation statistics and prints the results.
 
     Usage:
-        python "1.5 Percolation.py" n T
+        python PercolationStats.py n T [workers]
 
     Args:
         None (reads from sys.argv)
@@ -82,16 +400,19 @@ def main():
     """
 
     args = sys.argv[1:]  # args is a list of the command-line args
-    if len(args) != 2:
-        print('Usage: python PercolationStats.py n trials')
+    if len(args) not in (2, 3):
+        print('Usage: python PercolationStats.py n trials [workers]')
         return
 
-    n, T = map(int, args)
+    n, T = map(int, args[:2])
+    workers = int(args[2]) if len(args) == 3 else 1
     if n < 0 or T < 2:
         raise ValueError("'n' must be a positive integer, 'trials' must be equal or bigger than 2.")
+    if workers < 1:
+        raise ValueError("'workers' must be a positive integer.")
 
-    percolation = PercolationStats(n, T)
-    print(f"Received n = {n}, T = {T}")
+    percolation = PercolationStats(n, T, workers=workers)
+    print(f"Received n = {n}, T = {T}, workers = {workers}")
     print("mean                    =", percolation.mean())
     print("stddev                  =", percolation.stddev())
     print("95% confidence interval =", [percolation.confidenceLo(), percolation.confidenceHi()])
@@ -0,0 +1,137 @@
+from bisect import bisect_left
+from Percolation import Percolation
+from UnionFind import RollbackWeightedQuickUnionUF
+
+QUERIES = ("percolates", "isFull", "isOpen")
+
+
+class PercolationTimeline:
+    def __init__(self, n, events, lattice=None):
+        """
+        Answers the queries of a timeline of open and close events, offline.
+
+        Sites that fail and recover cannot be handled by union-find directly, since
+        unions cannot be split. Instead, every site is open during a set of time
+        intervals; the intervals are stored in a segment tree over the queries, and
+        a depth-first walk opens a node's sites on the way down and rolls them back
+        on the way up (divide and conquer with a rollback union-find). Each query is
+        then answered against exactly the sites open at its time.
+
+        With E events and Q queries this costs O(E log Q log n) in total, instead of
+        rebuilding the system after every close.
+
+        Args:
+            n (int): Grid size. Ignored if a lattice is given.
+            events (iterable[tuple]): Events in time order, each one of
+                ("open", row, col), ("close", row, col), ("percolates",),
+                ("isFull", row, col) or ("isOpen", row, col).
+            lattice (Lattice | None): Geometry of the system; see `Percolation`.
+
+        Raises:
+            ValueError: If an event is not recognized.
+        """
+
+        self.p = Percolation(n, RollbackWeightedQuickUnionUF, single=True, lattice=lattice)
+
+        # Split the events into queries and the intervals during which each site is open
+        self.queries = []  # (time, query event)
+        intervals = []  # (start time, end time, site)
+        opened = {}  # Site -> time it was opened, for the sites open now
+        for time, event in enumerate(events):
+            if event[0] in ("open", "close"):
+                position = self.p.getIndex(event[1], event[2])
+                if event[0] == "open" and position not in opened:
+                    opened[position] = time
+                elif event[0] == "close" and position in opened:
+                    intervals.append((opened.pop(position), time, position))
+            elif event[0] in QUERIES:
+                self.queries.append((time, event))
+            else:
+                raise ValueError(f"Unknown event {event!r}.")
+        intervals += [(start, float("inf"), position) for position, start in opened.items()]
+
+        # Map every interval onto the range of queries it covers and store it in the segment tree
+        self.answers_value = [None] * len(self.queries)
+        if not self.queries:
+            return
+
+        times = [time for time, event in self.queries]
+        self.tree = [[] for i in range(4 * len(times))]
+        for start, end, position in intervals:
+            first, last = bisect_left(times, start), bisect_left(times, end)
+            if first < last:
+                self._insert(1, 0, len(times), first, last, position)
+
+        self._solve(1, 0, len(times))
+
+    def _insert(self, node, lo, hi, first, last, position):
+        """
+        Stores a site in the O(log Q) segment tree nodes that cover queries [first, last).
+
+        Args:
+            node (int): Segment tree node covering queries [lo, hi).
+            lo (int): First query of the node.
+            hi (int): End of the node's query range (exclusive).
+            first (int): First query during which the site is open.
+            last (int): End of the site's query range (exclusive).
+            position (int): Flattened site index.
+        """
+
+        if first <= lo and hi <= last:
+            self.tree[node].append(position)
+            return
+
+        mid = (lo + hi) // 2
+        if first < mid:
+            self._insert(2 * node, lo, mid, first, last, position)
+        if mid < last:
+            self._insert(2 * node + 1, mid, hi, first, last, position)
+
+    def _solve(self, node, lo, hi):
+        """
+        Opens the node's sites, answers the queries below it and rolls the sites back.
+
+        Args:
+            node (int): Segment tree node covering queries [lo, hi).
+            lo (int): First query of the node.
+            hi (int): End of the node's query range (exclusive).
+        """
+
+        token = self.p.checkpoint()
+        self.p.open_indices(self.tree[node])
+
+        if hi - lo == 1:
+            self.answers_value[lo] = self._answer(self.queries[lo][1])
+        else:
+            mid = (lo + hi) // 2
+            self._solve(2 * node, lo, mid)
+            self._solve(2 * node + 1, mid, hi)
+
+        self.p.rollback(token)
+
+    def _answer(self, query):
+        """
+        Answers one query against the current state of the system.
+
+        Args:
+            query (tuple): A query event.
+
+        Returns:
+            bool: The answer to the query.
+        """
+
+        if query[0] == "percolates":
+            return self.p.percolates()
+        if query[0] == "isFull":
+            return self.p.isFull(query[1], query[2])
+        return self.p.isOpen(query[1], query[2])
+
+    def answers(self):
+        """
+        Returns the answers to the queries, in the order of the queries in the timeline.
+
+        Returns:
+            list[bool]: One answer per query event.
+        """
+
+        return self.answers_value
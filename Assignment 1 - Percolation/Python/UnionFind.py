@@ -1,4 +1,8 @@
+from array import array
+
 class WeightedQuickUnionUF:
+    compresses = True  # root() compresses paths (path halving)
+
     def __init__(self, n):
         """
         Initializes a Weighted Quick Union data structure.
@@ -66,3 +70,267 @@ class WeightedQuickUnionUF:
         else:
             self.id[j] = i
             self.size[i] += self.size[j]
+
+
+class CompactWeightedQuickUnionUF:
+    compresses = True  # root() compresses paths (path halving)
+
+    def __init__(self, n):
+        """
+        Initializes a memory-compact Weighted Quick Union data structure.
+
+        Parent links are stored in a typed array of C ints (4 bytes per site) and
+        the union-by-rank heights in a byte array (1 byte per site), instead of
+        Python lists of boxed ints. Ranks never exceed log2(n), so a byte is enough.
+
+        Args:
+            n (int): The number of sites in the system (must fit in a C int).
+        """
+        self.id = array('i', range(n))
+        self.rank = bytearray(n)
+
+    def root(self, i):
+        """
+        Finds the root (representative) of the component containing site i.
+
+        Args:
+            i (int): Site index.
+
+        Returns:
+            int: Root of the component.
+        """
+
+        id = self.id
+        # Chase parent pointers until reach root (path halving)
+        while id[i] != i:
+            id[i] = id[id[i]]
+            i = id[i]
+
+        return i
+
+    def connected(self, p, q):
+        """
+        Checks if sites p and q are in the same component.
+
+        Args:
+            p (int): Site index.
+            q (int): Site index.
+
+        Returns:
+            bool: True if p and q are connected, False otherwise.
+        """
+
+        return self.root(p) == self.root(q)
+
+    def union(self, p, q):
+        """
+        Merges the components containing sites p and q.
+
+        Args:
+            p (int): Site index.
+            q (int): Site index.
+        """
+
+        # Link the shorter tree below the taller one (union by rank)
+        i = self.root(p)
+        j = self.root(q)
+
+        if i == j:
+            return
+
+        rank = self.rank
+        if rank[i] < rank[j]:
+            self.id[i] = j
+
+        elif rank[i] > rank[j]:
+            self.id[j] = i
+
+        else:
+            self.id[j] = i
+            rank[i] += 1
+
+
+class RollbackWeightedQuickUnionUF:
+    compresses = False  # root() leaves paths alone so unions can be undone
+
+    def __init__(self, n):
+        """
+        Initializes a Weighted Quick Union data structure whose unions can be undone.
+
+        Uses union by size without path compression, so every union changes exactly
+        one parent link and trees stay O(log n) deep. Each union is recorded in a
+        change log, and `rollback()` undoes unions in reverse order.
+
+        Args:
+            n (int): The number of sites in the system.
+        """
+        self.id = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.history = []  # Roots linked below another root, in union order
+
+    def root(self, i):
+        """
+        Finds the root (representative) of the component containing site i.
+
+        Args:
+            i (int): Site index.
+
+        Returns:
+            int: Root of the component.
+        """
+
+        id = self.id
+        # Chase parent pointers until reach root (no path compression, to keep unions undoable)
+        while id[i] != i:
+            i = id[i]
+
+        return i
+
+    def connected(self, p, q):
+        """
+        Checks if sites p and q are in the same component.
+
+        Args:
+            p (int): Site index.
+            q (int): Site index.
+
+        Returns:
+            bool: True if p and q are connected, False otherwise.
+        """
+
+        return self.root(p) == self.root(q)
+
+    def union(self, p, q):
+        """
+        Merges the components containing sites p and q and records the change.
+
+        Args:
+            p (int): Site index.
+            q (int): Site index.
+        """
+
+        i = self.root(p)
+        j = self.root(q)
+
+        if i == j:
+            return
+
+        if self.size[i] < self.size[j]:
+            i, j = j, i
+
+        self.id[j] = i
+        self.size[i] += self.size[j]
+        self.history.append(j)
+
+    def checkpoint(self):
+        """
+        Returns a token for the current state, to be passed to `rollback()`.
+
+        Returns:
+            int: Number of unions performed so far.
+        """
+
+        return len(self.history)
+
+    def rollback(self, token):
+        """
+        Undoes every union performed since `checkpoint()` returned token.
+
+        Tokens taken after that checkpoint become invalid.
+
+        Args:
+            token (int): Value returned by `checkpoint()`.
+        """
+
+        id, size, history = self.id, self.size, self.history
+        while len(history) > token:
+            j = history.pop()
+            i = id[j]
+            size[i] -= size[j]
+            id[j] = j
+
+
+COUNTERS = ("roots", "path_length", "compressions", "unions", "max_height")
+
+_instrumented = {}  # Instrumented subclass per union-find class
+
+
+def instrumented(uf_class):
+    """
+    Returns a subclass of a union-find class that counts the work it does.
+
+    The counters are `roots` (calls to root), `path_length` (parent links followed
+    in total), `compressions` (parent links rewritten by path compression), `unions`
+    (calls to union) and `max_height` (longest root path walked). The plain classes
+    are left untouched, so code that does not ask for instrumentation pays nothing.
+
+    Args:
+        uf_class (type): A union-find class such as `WeightedQuickUnionUF`.
+
+    Returns:
+        type: The instrumented subclass, with a `counters()` method.
+    """
+
+    if uf_class not in _instrumented:
+        class Instrumented(uf_class):
+            def __init__(self, n):
+                super().__init__(n)
+                self.roots = self.path_length = self.compressions = self.unions = self.max_height = 0
+
+            def root(self, i):
+                id = self.id
+                length = 0
+                # Same walk as the parent class (path halving when it compresses), with counting
+                while id[i] != i:
+                    parent = id[i]
+                    if self.compresses and id[parent] != parent:
+                        id[i] = id[parent]
+                        self.compressions += 1
+                    i = id[i]
+                    length += 1
+
+                self.roots += 1
+                self.path_length += length
+                self.max_height = max(self.max_height, length)
+                return i
+
+            def union(self, p, q):
+                self.unions += 1
+                super().union(p, q)
+
+            def counters(self):
+                """
+                Returns the work counters of this union-find.
+
+                Returns:
+                    dict[str, int]: Value of every counter in COUNTERS.
+                """
+
+                return {name: getattr(self, name) for name in COUNTERS}
+
+        Instrumented.__name__ = Instrumented.__qualname__ = "Instrumented" + uf_class.__name__
+        _instrumented[uf_class] = Instrumented
+
+    return _instrumented[uf_class]
+
+
+def mergeCounters(*counters):
+    """
+    Combines counters of several instrumented union-finds: totals are added,
+    `max_height` is the maximum.
+
+    Args:
+        *counters (dict[str, int]): Results of `counters()`.
+
+    Returns:
+        dict[str, int]: The combined counters.
+    """
+
+    merged = dict.fromkeys(COUNTERS, 0)
+    for counter in counters:
+        for name in COUNTERS:
+            if name == "max_height":
+                merged[name] = max(merged[name], counter[name])
+            else:
+                merged[name] += counter[name]
+    return merged
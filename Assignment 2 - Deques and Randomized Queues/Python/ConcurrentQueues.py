@@ -0,0 +1,362 @@
+"""
+Thread-safe and asyncio versions of `Deque` and `RandomizedQueue` for producer-consumer pipelines.
+
+- `ConcurrentDeque`, `ConcurrentRandomizedQueue`: safe to share between threads. `put` blocks while
+  a bounded queue is full and `get` blocks while the queue is empty, both with optional timeouts
+  (raising `queue.Full` / `queue.Empty` like the standard library `queue` module).
+- `AsyncDeque`, `AsyncRandomizedQueue`: the same operations as coroutines, for one event loop
+  (raising `asyncio.QueueFull` / `asyncio.QueueEmpty` on timeout).
+
+Usage:
+- Create a bounded queue: `jobs = ConcurrentRandomizedQueue(maxsize=1000)`
+- Producers: `jobs.put(item)`, or `jobs.put(item, timeout=1.0)`
+- Consumers: `item = jobs.get()`, or `jobs.get(block=False)`
+- Asyncio: `item = await async_jobs.get(timeout=1.0)`
+
+Note: One lock guards each queue, and it is only held for the O(1) operation on the underlying
+structure; waiting happens on condition variables with the lock released. Producers wait on
+`not_full` and consumers on `not_empty`, so a put only wakes a consumer and a get only a producer.
+"""
+
+
+import queue
+import asyncio
+import threading
+from Deque import Deque
+from RandomizedQueue import RandomizedQueue
+
+class _BlockingQueue:
+    def __init__(self, maxsize, size):
+        """
+        Initializes the locking shared by the thread-safe queues.
+
+        Args:
+            maxsize: Maximum number of items; 0 or less means unbounded.
+            size: Callable returning the number of items of the underlying structure.
+        """
+        self.maxsize = maxsize
+        self._size = size
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock) # Consumers wait here
+        self.not_full = threading.Condition(self.lock) # Producers wait here
+
+    def _full(self):
+        return 0 < self.maxsize <= self._size()
+
+    def _put(self, add, item, block, timeout):
+        """
+        Adds an item with the given operation, waiting for room if the queue is bounded.
+
+        Args:
+            add: Operation of the underlying structure that adds the item.
+            item: The item to add.
+            block: Whether to wait for room.
+            timeout: Maximum number of seconds to wait, or None to wait forever.
+
+        Raises:
+            queue.Full: If there is no room in time.
+        """
+        with self.not_full:
+            if not self.not_full.wait_for(lambda: not self._full(), timeout if block else 0):
+                raise queue.Full
+            add(item)
+            self.not_empty.notify()
+
+    def _get(self, remove, block, timeout, removes=True):
+        """
+        Takes an item with the given operation, waiting for one if the queue is empty.
+
+        Args:
+            remove: Operation of the underlying structure that returns the item.
+            block: Whether to wait for an item.
+            timeout: Maximum number of seconds to wait, or None to wait forever.
+            removes: Whether the operation removes the item (and frees room).
+
+        Returns:
+            The item.
+
+        Raises:
+            queue.Empty: If there is no item in time.
+        """
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: self._size() > 0, timeout if block else 0):
+                raise queue.Empty
+            item = remove()
+            if removes:
+                self.not_full.notify()
+            else:
+                self.not_empty.notify() # Pass the wake-up on to a waiting getter
+            return item
+
+    def qsize(self):
+        """
+        Returns the number of items in the queue (may change as soon as it is returned).
+
+        Returns:
+            Number of items.
+        """
+        with self.lock:
+            return self._size()
+
+
+class ConcurrentDeque(_BlockingQueue):
+    def __init__(self, maxsize=0):
+        """
+        Initializes an empty thread-safe deque.
+
+        Args:
+            maxsize: Maximum number of items; 0 or less means unbounded.
+        """
+        self.deque = Deque()
+        super().__init__(maxsize, self.deque.size)
+
+    def put_first(self, item, block=True, timeout=None):
+        """
+        Adds an item to the front, waiting for room if the deque is bounded.
+
+        Raises:
+            queue.Full: If there is no room in time.
+        """
+        self._put(self.deque.addFirst, item, block, timeout)
+
+    def put_last(self, item, block=True, timeout=None):
+        """
+        Adds an item to the back, waiting for room if the deque is bounded.
+
+        Raises:
+            queue.Full: If there is no room in time.
+        """
+        self._put(self.deque.addLast, item, block, timeout)
+
+    def get_first(self, block=True, timeout=None):
+        """
+        Removes and returns the item at the front, waiting for one if the deque is empty.
+
+        Raises:
+            queue.Empty: If there is no item in time.
+        """
+        return self._get(self.deque.removeFirst, block, timeout)
+
+    def get_last(self, block=True, timeout=None):
+        """
+        Removes and returns the item at the back, waiting for one if the deque is empty.
+
+        Raises:
+            queue.Empty: If there is no item in time.
+        """
+        return self._get(self.deque.removeLast, block, timeout)
+
+    put = put_last # FIFO by default, like queue.Queue
+    get = get_first
+
+
+class ConcurrentRandomizedQueue(_BlockingQueue):
+    def __init__(self, maxsize=0):
+        """
+        Initializes an empty thread-safe randomized queue.
+
+        Args:
+            maxsize: Maximum number of items; 0 or less means unbounded.
+        """
+        self.queue = RandomizedQueue()
+        super().__init__(maxsize, self.queue.size)
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Adds an item, waiting for room if the queue is bounded.
+
+        Raises:
+            ValueError: If the item is None.
+            queue.Full: If there is no room in time.
+        """
+        self._put(self.queue.enqueue, item, block, timeout)
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes and returns a random item, waiting for one if the queue is empty.
+
+        Raises:
+            queue.Empty: If there is no item in time.
+        """
+        return self._get(self.queue.dequeue, block, timeout)
+
+    def sample(self, block=True, timeout=None):
+        """
+        Returns a random item without removing it, waiting for one if the queue is empty.
+
+        Raises:
+            queue.Empty: If there is no item in time.
+        """
+        return self._get(self.queue.sample, block, timeout, removes=False)
+
+
+class _AsyncQueue:
+    def __init__(self, maxsize, size):
+        """
+        Initializes the locking shared by the asyncio queues.
+
+        Args:
+            maxsize: Maximum number of items; 0 or less means unbounded.
+            size: Callable returning the number of items of the underlying structure.
+        """
+        self.maxsize = maxsize
+        self._size = size
+        self.lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(self.lock) # Consumers wait here
+        self.not_full = asyncio.Condition(self.lock) # Producers wait here
+
+    def _full(self):
+        return 0 < self.maxsize <= self._size()
+
+    @staticmethod
+    async def _wait(condition, predicate, timeout):
+        """
+        Waits on a condition (whose lock is held) until the predicate holds.
+
+        Args:
+            condition: The condition to wait on.
+            predicate: Callable checked after every wake-up.
+            timeout: Maximum number of seconds to wait, or None to wait forever.
+
+        Returns:
+            True if the predicate holds, False on timeout.
+        """
+        if predicate():
+            return True
+        if timeout is not None and timeout <= 0:
+            return False
+        try:
+            await asyncio.wait_for(condition.wait_for(predicate), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _put(self, add, item, timeout):
+        """
+        Adds an item with the given operation, waiting for room if the queue is bounded.
+
+        Raises:
+            asyncio.QueueFull: If there is no room in time.
+        """
+        async with self.lock:
+            if not await self._wait(self.not_full, lambda: not self._full(), timeout):
+                raise asyncio.QueueFull
+            add(item)
+            self.not_empty.notify()
+
+    async def _get(self, remove, timeout, removes=True):
+        """
+        Takes an item with the given operation, waiting for one if the queue is empty.
+
+        Raises:
+            asyncio.QueueEmpty: If there is no item in time.
+        """
+        async with self.lock:
+            if not await self._wait(self.not_empty, lambda: self._size() > 0, timeout):
+                raise asyncio.QueueEmpty
+            item = remove()
+            if removes:
+                self.not_full.notify()
+            else:
+                self.not_empty.notify() # Pass the wake-up on to a waiting getter
+            return item
+
+    def qsize(self):
+        """
+        Returns the number of items in the queue.
+
+        Returns:
+            Number of items.
+        """
+        return self._size()
+
+
+class AsyncDeque(_AsyncQueue):
+    def __init__(self, maxsize=0):
+        """
+        Initializes an empty asyncio deque.
+
+        Args:
+            maxsize: Maximum number of items; 0 or less means unbounded.
+        """
+        self.deque = Deque()
+        super().__init__(maxsize, self.deque.size)
+
+    async def put_first(self, item, timeout=None):
+        """
+        Adds an item to the front, waiting for room if the deque is bounded.
+
+        Raises:
+            asyncio.QueueFull: If there is no room in time (timeout=0 does not wait).
+        """
+        await self._put(self.deque.addFirst, item, timeout)
+
+    async def put_last(self, item, timeout=None):
+        """
+        Adds an item to the back, waiting for room if the deque is bounded.
+
+        Raises:
+            asyncio.QueueFull: If there is no room in time (timeout=0 does not wait).
+        """
+        await self._put(self.deque.addLast, item, timeout)
+
+    async def get_first(self, timeout=None):
+        """
+        Removes and returns the item at the front, waiting for one if the deque is empty.
+
+        Raises:
+            asyncio.QueueEmpty: If there is no item in time (timeout=0 does not wait).
+        """
+        return await self._get(self.deque.removeFirst, timeout)
+
+    async def get_last(self, timeout=None):
+        """
+        Removes and returns the item at the back, waiting for one if the deque is empty.
+
+        Raises:
+            asyncio.QueueEmpty: If there is no item in time (timeout=0 does not wait).
+        """
+        return await self._get(self.deque.removeLast, timeout)
+
+    put = put_last # FIFO by default, like asyncio.Queue
+    get = get_first
+
+
+class AsyncRandomizedQueue(_AsyncQueue):
+    def __init__(self, maxsize=0):
+        """
+        Initializes an empty asyncio randomized queue.
+
+        Args:
+            maxsize: Maximum number of items; 0 or less means unbounded.
+        """
+        self.queue = RandomizedQueue()
+        super().__init__(maxsize, self.queue.size)
+
+    async def put(self, item, timeout=None):
+        """
+        Adds an item, waiting for room if the queue is bounded.
+
+        Raises:
+            ValueError: If the item is None.
+            asyncio.QueueFull: If there is no room in time (timeout=0 does not wait).
+        """
+        await self._put(self.queue.enqueue, item, timeout)
+
+    async def get(self, timeout=None):
+        """
+        Removes and returns a random item, waiting for one if the queue is empty.
+
+        Raises:
+            asyncio.QueueEmpty: If there is no item in time (timeout=0 does not wait).
+        """
+        return await self._get(self.queue.dequeue, timeout)
+
+    async def sample(self, timeout=None):
+        """
+        Returns a random item without removing it, waiting for one if the queue is empty.
+
+        Raises:
+            asyncio.QueueEmpty: If there is no item in time (timeout=0 does not wait).
+        """
+        return await self._get(self.queue.sample, timeout, removes=False)
@@ -1,7 +1,7 @@
 """
 The `Deque` class represents a double-ended queue (deque) that allows adding and removing items
-from both ends of the collection. It uses a doubly linked list implementation for efficient
-operations at both ends.
+from both ends of the collection. It uses a growable circular array (ring buffer) for efficient
+operations at both ends, constant-time indexed access and compact storage.
 
 Usage:
 - Create a deque: `my_deque = Deque()`
@@ -9,43 +9,35 @@ Usage:
 - Add items to the back: `my_deque.addLast(item)`
 - Remove an item from the front: `my_deque.removeFirst()`
 - Remove an item from the back: `my_deque.removeLast()`
+- Access an item by position: `my_deque[i]`
+- Rotate the items: `my_deque.rotate(k)`
 - Iterate over items: `for item in my_deque.Iterator(): ...`
 
-Note: The `Deque` class includes an inner `Node` class for representing nodes in the linked list.
+Note: The array doubles when full and halves when it is a quarter full, so every operation at
+the ends takes amortized constant time and the array never holds more than four times the items.
 """
 
 class Deque:
+    MIN_CAPACITY = 8  # The array never shrinks below this many slots
+
     def __init__(self):
         """
         Initializes an empty deque.
         """
-        self.first = None
-        self.last = None
-        self.size = 0
-
-    class Node:
-        def __init__(self, val, next = None, prev = None):
-            """
-            Represents a node in the doubly linked list.
-
-            Args:
-                val: The value stored in the node.
-                next: Reference to the next node.
-                prev: Reference to the previous node.
-            """
-            self.val = val
-            self.next = next
-            self.prev = prev
+        self.items = [None] * self.MIN_CAPACITY  # Circular array of items
+        self.head = 0  # Index of the first item in the array
+        self.n = 0  # Number of items in the deque
 
     class IteratorClass:
-        def __init__(self, head):
+        def __init__(self, deque):
             """
             Initializes an iterator for the deque.
 
             Args:
-                head: The starting node for iteration.
+                deque: The deque to iterate over, from front to back.
             """
-            self.head = head
+            self.deque = deque
+            self.i = 0
 
         def __iter__(self):
             return self
@@ -58,12 +50,11 @@ class Deque:
                 StopIteration: When there are no more items to iterate.
 
             Returns:
-                The value of the current node.
+                The next item.
             """
-            curr = self.head
-            if curr:
-                item = curr.val
-                self.head = curr.next
+            if self.i < self.deque.n:
+                item = self.deque[self.i]
+                self.i += 1
                 return item
             else:
                 raise StopIteration
@@ -75,7 +66,7 @@ class Deque:
         Returns:
             True if the deque is empty, False otherwise.
         """
-        return self.first == None
+        return self.n == 0
 
     def size(self):
         """
@@ -84,7 +75,32 @@ class Deque:
         Returns:
             The number of items.
         """
-        return self.size
+        return self.n
+
+    def __len__(self):
+        return self.n
+
+    def _resize(self, capacity):
+        """
+        Moves the items to a new array of the given capacity, starting at index 0.
+
+        Args:
+            capacity: The number of slots of the new array.
+        """
+        items, head, cap = self.items, self.head, len(self.items)
+        end = head + self.n
+        resized = items[head:min(end, cap)] + items[:max(end - cap, 0)]
+        resized += [None] * (capacity - self.n)
+        self.items = resized
+        self.head = 0
+
+    def _shrink(self):
+        """
+        Halves the array when it is a quarter full.
+        """
+        cap = len(self.items)
+        if cap > self.MIN_CAPACITY and self.n <= cap // 4:
+            self._resize(cap // 2)
 
     def addFirst(self, val):
         """
@@ -96,13 +112,11 @@ class Deque:
         Raises:
             ValueError: If the input item is None.
         """
-        self.size += 1
-        if self.isEmpty():
-            self.first = self.last = self.Node(val)
-        else:
-            new_node = self.Node(val, next = self.first)
-            self.first.prev = new_node
-            self.first = new_node
+        if self.n == len(self.items):
+            self._resize(2 * len(self.items))
+        self.head = (self.head - 1) % len(self.items)
+        self.items[self.head] = val
+        self.n += 1
 
     def addLast(self, val):
         """
@@ -114,13 +128,10 @@ class Deque:
         Raises:
             ValueError: If the input item is None.
         """
-        self.size += 1
-        if self.isEmpty():
-            self.first = self.last = self.Node(val)
-        else:
-            new_node = self.Node(val, prev = self.last)
-            self.last.next = new_node
-            self.last = new_node
+        if self.n == len(self.items):
+            self._resize(2 * len(self.items))
+        self.items[(self.head + self.n) % len(self.items)] = val
+        self.n += 1
 
     def removeFirst(self):
         """
@@ -135,13 +146,11 @@ class Deque:
         if self.isEmpty():
             print('The list is empty')
         else:
-            self.size -= 1
-            item = self.first.val
-            self.first = self.first.next
-            if self.first == None:
-                self.last = None
-            else:
-                self.first.prev = None
+            item = self.items[self.head]
+            self.items[self.head] = None  # Drop the reference so the item can be collected
+            self.head = (self.head + 1) % len(self.items)
+            self.n -= 1
+            self._shrink()
             return item
 
     def removeLast(self):
@@ -157,15 +166,79 @@ class Deque:
         if self.isEmpty():
             print('The list is empty')
         else:
-            self.size -= 1
-            item = self.last.val
-            self.last = self.last.prev
-            if self.last == None:
-                self.first = None
-            else:
-                self.last.next = None
+            last = (self.head + self.n - 1) % len(self.items)
+            item = self.items[last]
+            self.items[last] = None  # Drop the reference so the item can be collected
+            self.n -= 1
+            self._shrink()
             return item
 
+    def __getitem__(self, i):
+        """
+        Returns the item at position i, counting from the front (negative i counts from the back).
+
+        Args:
+            i: Position of the item.
+
+        Returns:
+            The item at position i.
+
+        Raises:
+            IndexError: If i is out of range.
+        """
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("Deque index out of range")
+        return self.items[(self.head + i) % len(self.items)]
+
+    def __setitem__(self, i, val):
+        """
+        Replaces the item at position i, counting from the front (negative i counts from the back).
+
+        Args:
+            i: Position of the item.
+            val: The new item.
+
+        Raises:
+            IndexError: If i is out of range.
+        """
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("Deque index out of range")
+        self.items[(self.head + i) % len(self.items)] = val
+
+    def rotate(self, k=1):
+        """
+        Rotates the deque k steps to the right (items move from the back to the front).
+        Negative k rotates to the left. Takes O(min(k, n - k)) time.
+
+        Args:
+            k: Number of steps.
+        """
+        if self.n <= 1:
+            return
+        k %= self.n
+        if k > self.n // 2:
+            k -= self.n  # Rotating the other way is shorter
+
+        items, cap = self.items, len(self.items)
+        if self.n == cap:
+            # The array is full, so rotating only moves the front
+            self.head = (self.head - k) % cap
+            return
+
+        for _ in range(k):
+            # Move the last item in front of the first one
+            last = (self.head + self.n - 1) % cap
+            self.head = (self.head - 1) % cap
+            items[self.head], items[last] = items[last], None
+        for _ in range(-k):
+            # Move the first item behind the last one
+            items[(self.head + self.n) % cap], items[self.head] = items[self.head], None
+            self.head = (self.head + 1) % cap
+
     def Iterator(self):
         """
         Returns an iterator over items in order from front to back.
@@ -173,7 +246,7 @@ class Deque:
         Returns:
             An iterator.
         """
-        return self.IteratorClass(self.first)
+        return self.IteratorClass(self)
 
     def __str__(self):
         """
@@ -182,12 +255,7 @@ class Deque:
         Returns:
             A string showing the items in the deque.
         """
-        curr = self.first
-        sequence = []
-        while curr:
-            sequence.append(str(curr.val))
-            curr = curr.next
-        return ' <-> '.join(sequence)
+        return ' <-> '.join(str(self[i]) for i in range(self.n))
 
     def reversed(self):
         """
@@ -196,9 +264,4 @@ class Deque:
         Returns:
             A string showing the items in reverse order.
         """
-        curr = self.last
-        sequence = []
-        while curr:
-            sequence.append(str(curr.val))
-            curr = curr.prev
-        return ' <-> '.join(sequence)
\ No newline at end of file
+        return ' <-> '.join(str(self[i]) for i in range(self.n - 1, -1, -1))
@@ -0,0 +1,226 @@
+"""
+The `MappedArray` class represents a growable array of fixed-size numbers stored in a memory-mapped
+temporary file instead of the Python heap. It supports the operations of `array.array` that
+`RandomizedQueue` relies on, so a typed queue can move its items to disk once it grows too large.
+
+Usage:
+- Create an array of 64-bit integers: `a = MappedArray('q')`
+- Add items: `a.append(x)`, `a.extend(items)`, `a.frombytes(buffer)`
+- Access items: `a[i]`, `a[i] = x`, `a.pop()`, `del a[k:]`
+- Release the file: `a.close()`
+
+Note: Records are stored unboxed in `itemsize` bytes each, like `array.array`. The operating system
+pages the mapped file in and out as needed, so the array can be far larger than physical memory. The
+file doubles when full and halves when a quarter full, like the array of `Deque`.
+"""
+
+
+import mmap
+import tempfile
+from array import array
+from collections.abc import Sequence
+
+class MappedArray(Sequence):
+    MIN_CAPACITY = 1024  # The file never shrinks below this many records
+    CHUNK = 1 << 16  # Items packed per write when extending from an iterable
+
+    def __init__(self, dtype, items=None, directory=None):
+        """
+        Initializes a memory-mapped array.
+
+        Args:
+            dtype: An `array` typecode, such as 'q' for 64-bit integers or 'd' for doubles.
+            items: Optional `array.array` of the same typecode to copy into the file.
+            directory: Directory of the temporary file; None uses the system default.
+                The file is deleted when the array is closed or garbage collected.
+
+        Raises:
+            ValueError: If the typecode is not supported.
+        """
+        self.dtype = dtype
+        self.itemsize = array(dtype).itemsize
+        self.file = tempfile.TemporaryFile(dir=directory)
+        self.map = None
+        self.view = None # Typed view of the mapped file
+        self.n = 0 # Number of items in the array
+        self._resize(self.MIN_CAPACITY)
+        if items is not None:
+            self.frombytes(memoryview(items).cast('B'))
+
+    def _resize(self, capacity):
+        """
+        Changes the size of the file to the given number of records and maps it again.
+
+        Args:
+            capacity: The number of records of the file.
+        """
+        self._unmap()
+        self.file.truncate(capacity * self.itemsize)
+        self.map = mmap.mmap(self.file.fileno(), capacity * self.itemsize)
+        self.view = memoryview(self.map).cast(self.dtype)
+
+    def _unmap(self):
+        """
+        Releases the typed view and the mapping, which must be done before the file changes size.
+        """
+        if self.view is not None:
+            self.view.release()
+            self.map.close()
+            self.view = self.map = None
+
+    def _reserve(self, n):
+        """
+        Grows the file, doubling its size, until it can hold n records.
+
+        Args:
+            n: The number of records needed.
+        """
+        capacity = len(self.view)
+        if n > capacity:
+            while capacity < n:
+                capacity *= 2
+            self._resize(capacity)
+
+    def _shrink(self):
+        """
+        Halves the file when it is a quarter full.
+        """
+        capacity = len(self.view)
+        if capacity > self.MIN_CAPACITY and self.n <= capacity // 4:
+            self._resize(capacity // 2)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        """
+        Returns the item at index i (negative i counts from the end).
+
+        Args:
+            i: Index of the item.
+
+        Returns:
+            The item at index i.
+
+        Raises:
+            IndexError: If i is out of range.
+        """
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("MappedArray index out of range")
+        return self.view[i]
+
+    def __setitem__(self, i, item):
+        """
+        Replaces the item at index i (negative i counts from the end).
+
+        Args:
+            i: Index of the item.
+            item: The new item.
+
+        Raises:
+            IndexError: If i is out of range.
+        """
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("MappedArray index out of range")
+        self.view[i] = item
+
+    def __delitem__(self, index):
+        """
+        Removes the items from a position to the end (`del a[k:]`), the only deletion supported.
+
+        Args:
+            index: A slice with only a start.
+
+        Raises:
+            ValueError: If index is not a slice to the end of the array.
+        """
+        if not isinstance(index, slice) or index.stop is not None or index.step is not None:
+            raise ValueError("MappedArray only supports deleting a tail slice")
+        start, stop, step = index.indices(self.n)
+        self.n = min(start, self.n)
+        self._shrink()
+
+    def append(self, item):
+        """
+        Adds an item to the end of the array.
+
+        Args:
+            item: The item to add.
+        """
+        if self.n == len(self.view):
+            self._resize(2 * len(self.view))
+        self.view[self.n] = item
+        self.n += 1
+
+    def pop(self):
+        """
+        Removes and returns the last item.
+
+        Returns:
+            The last item.
+
+        Raises:
+            IndexError: If the array is empty.
+        """
+        if self.n == 0:
+            raise IndexError("pop from empty MappedArray")
+        self.n -= 1
+        item = self.view[self.n]
+        self._shrink()
+        return item
+
+    def frombytes(self, data):
+        """
+        Appends items from a buffer of packed records, as one block copy.
+
+        Args:
+            data: A bytes-like object whose length is a multiple of itemsize.
+
+        Raises:
+            ValueError: If the length of data is not a multiple of itemsize.
+        """
+        data = memoryview(data).cast('B')
+        if len(data) % self.itemsize:
+            raise ValueError("bytes length not a multiple of item size")
+        count = len(data) // self.itemsize
+        self._reserve(self.n + count)
+        start = self.n * self.itemsize
+        self.map[start:start + len(data)] = data
+        self.n += count
+
+    def extend(self, items):
+        """
+        Appends items from an iterable, packing them in chunks. If an item does not fit,
+        none of the items is added.
+
+        Args:
+            items: An iterable of numbers of the array's type.
+
+        Raises:
+            TypeError: If an item does not fit the type of the array.
+        """
+        n = self.n
+        try:
+            chunk = array(self.dtype)
+            for item in items:
+                chunk.append(item)
+                if len(chunk) == self.CHUNK:
+                    self.frombytes(chunk)
+                    chunk = array(self.dtype)
+            self.frombytes(chunk)
+        except BaseException:
+            self.n = n # Forget the chunks already written
+            self._shrink()
+            raise
+
+    def close(self):
+        """
+        Unmaps and deletes the file. The array must not be used afterwards.
+        """
+        self._unmap()
+        self.file.close()
+        self.n = 0
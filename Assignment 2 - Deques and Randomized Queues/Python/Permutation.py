@@ -0,0 +1,78 @@
+"""
+The `Permutation` client reads strings from standard input and prints `k` of them, chosen uniformly
+at random. It streams the input with reservoir sampling on top of a `RandomizedQueue`, so it makes a
+single pass and keeps only `k` strings in memory, however large the input is.
+
+Usage:
+- Run: `python Permutation.py k < input.txt`
+  (where `k` is the number of random strings to print)
+"""
+
+
+import sys
+import random
+from RandomizedQueue import RandomizedQueue
+
+def tokens(stream):
+    """
+    Reads whitespace-separated strings from a text stream, one line at a time.
+
+    Args:
+        stream: A text stream, such as sys.stdin.
+
+    Yields:
+        Each string in the stream.
+    """
+    for line in stream:
+        yield from line.split()
+
+def reservoir(items, k):
+    """
+    Selects k items uniformly at random from an iterable in a single pass (reservoir sampling).
+
+    The first k items fill the queue. After that, the i-th item replaces a random item of the
+    queue with probability k / i, so every k-subset of the items seen so far is equally likely.
+
+    Args:
+        items: An iterable of items.
+        k: The number of items to select.
+
+    Returns:
+        A RandomizedQueue holding the selected items (all items if there are fewer than k).
+    """
+    queue = RandomizedQueue()
+    if k <= 0:
+        return queue
+
+    for i, item in enumerate(items, 1):
+        if i <= k:
+            queue.enqueue(item)
+        elif random.randrange(i) < k:
+            queue.dequeue()
+            queue.enqueue(item)
+    return queue
+
+def main():
+    """
+    Entry point for the Permutation client.
+
+    Reads the integer k from the command line and prints k strings from standard input,
+    uniformly at random and in random order.
+    """
+    args = sys.argv[1:]
+    if len(args) != 1:
+        print('Usage: python Permutation.py k < input.txt')
+        return
+
+    k = int(args[0])
+    if k < 0:
+        raise ValueError("'k' must be a non-negative integer.")
+
+    # Dequeue and print the selected strings
+    queue = reservoir(tokens(sys.stdin), k)
+    while not queue.is_empty():
+        print(queue.dequeue())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Benchmarks `Deque` and `RandomizedQueue` against the standard library: `collections.deque` and a
+plain list with `random.randrange` (swap-with-last removal).
+
+Workloads, each on a structure filled with n items:
+- fill: n pushes into an empty structure
+- push_pop: a random mix of pushes and pops (FIFO pops for the deques, random ones for the queues)
+- iterator: creating an iterator and reading its first item
+- sample: random samples without removal (queues only)
+- memory: bytes per item after the fill, traced with tracemalloc (the int items included)
+
+Usage:
+- Run the suite (10^3 to 10^7 items) and save a JSON report: `python QueueBenchmark.py output.json`
+- Compare with an earlier report: `python QueueBenchmark.py output.json baseline.json`
+  (exits with status 1 if a case got slower, or bigger, by more than REGRESSION_TOLERANCE)
+"""
+
+
+import sys
+import json
+import time
+import random
+import platform
+import tracemalloc
+import collections
+from datetime import datetime, timezone
+from Deque import Deque
+from RandomizedQueue import RandomizedQueue
+
+# Structures compared by the benchmark: label -> whether it is a randomized queue
+STRUCTURES = {
+    "Deque": False,
+    "collections.deque": False,
+    "RandomizedQueue": True,
+    "RandomizedQueue (typed)": True,
+    "list + randrange": True,
+}
+
+WORKLOADS = ("fill", "push_pop", "iterator", "sample", "memory")
+MIX_OPERATIONS = 100000  # Operations of the push_pop workload
+SAMPLES = 100000  # Calls of the sample workload
+MIN_SECONDS = 0.2  # The iterator workload repeats until it has run this long...
+MAX_ITERATORS = 1000  # ...or created this many iterators
+
+# Default grid of the benchmark suite
+SUITE_N = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+REGRESSION_TOLERANCE = 0.10  # Slowdown (or growth) against the baseline reported as a regression
+
+
+def listDequeue(items):
+    """
+    Removes and returns a random item of a list, swapping the last item into its place.
+
+    Args:
+        items: A non-empty list.
+
+    Returns:
+        The removed item.
+    """
+    index = random.randrange(len(items))
+    item = items[index]
+    items[index] = items[-1]
+    items.pop()
+    return item
+
+
+def operations(structure):
+    """
+    Creates an empty structure and binds its operations under common names.
+
+    Args:
+        structure: A label of STRUCTURES.
+
+    Returns:
+        A dict with "push", "pop", "iterator" and, for queues, "sample" callables.
+    """
+    if structure == "Deque":
+        d = Deque()
+        return {"push": d.addLast, "pop": d.removeFirst, "iterator": d.Iterator}
+    if structure == "collections.deque":
+        d = collections.deque()
+        return {"push": d.append, "pop": d.popleft, "iterator": d.__iter__}
+    if structure == "list + randrange":
+        s = []
+        return {"push": s.append, "pop": lambda: listDequeue(s),
+                "sample": lambda: s[random.randrange(len(s))],
+                "iterator": lambda: iter(random.sample(s, len(s)))}
+
+    q = RandomizedQueue(dtype='q' if structure == "RandomizedQueue (typed)" else None)
+    return {"push": q.enqueue, "pop": q.dequeue, "sample": q.sample, "iterator": q.iterator}
+
+
+def mix(count, seed):
+    """
+    Draws a random sequence of pushes and pops that never pops more than it pushed.
+
+    Args:
+        count: The number of operations.
+        seed: Seed of the sequence.
+
+    Returns:
+        A list of booleans, True for a push.
+    """
+    rng = random.Random(seed)
+    pushes, balance = [], 0
+    for i in range(count):
+        push = balance == 0 or rng.random() < 0.5
+        balance += 1 if push else -1
+        pushes.append(push)
+    return pushes
+
+
+def fill(ops, n):
+    """
+    Pushes the integers 0 to n - 1.
+
+    Args:
+        ops: Operations from `operations`.
+        n: The number of items.
+    """
+    push = ops["push"]
+    for i in range(n):
+        push(i)
+
+
+def runWorkload(structure, workload, n, seed=0):
+    """
+    Runs one workload on one structure.
+
+    Args:
+        structure: A label of STRUCTURES.
+        workload: One of WORKLOADS.
+        n: The number of items.
+        seed: Seed of the random generators.
+
+    Returns:
+        A tuple (seconds, operations, bytes per item or None).
+    """
+    random.seed(seed)
+    ops = operations(structure)
+
+    if workload == "memory":
+        tracemalloc.start()
+        start = time.perf_counter()
+        fill(ops, n)
+        seconds = time.perf_counter() - start
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return seconds, n, size / n
+
+    start = time.perf_counter()
+    fill(ops, n)
+    seconds = time.perf_counter() - start
+    if workload == "fill":
+        return seconds, n, None
+
+    if workload == "push_pop":
+        pushes = mix(MIX_OPERATIONS, seed)
+        push, pop = ops["push"], ops["pop"]
+        start = time.perf_counter()
+        for i, is_push in enumerate(pushes):
+            if is_push:
+                push(i)
+            else:
+                pop()
+        return time.perf_counter() - start, len(pushes), None
+
+    if workload == "sample":
+        sample = ops["sample"]
+        start = time.perf_counter()
+        for i in range(SAMPLES):
+            sample()
+        return time.perf_counter() - start, SAMPLES, None
+
+    iterator, count = ops["iterator"], 0
+    start = time.perf_counter()
+    while count < MAX_ITERATORS and (count == 0 or time.perf_counter() - start < MIN_SECONDS):
+        next(iterator())
+        count += 1
+    return time.perf_counter() - start, count, None
+
+
+def workloads(structure):
+    """
+    Returns the workloads that apply to a structure.
+
+    Args:
+        structure: A label of STRUCTURES.
+
+    Returns:
+        A list of workload names.
+    """
+    return [w for w in WORKLOADS if w != "sample" or STRUCTURES[structure]]
+
+
+def describe(structure, workload, n):
+    """
+    Returns the name of a case, which also identifies it in a baseline report.
+
+    Args:
+        structure: A label of STRUCTURES.
+        workload: One of WORKLOADS.
+        n: The number of items.
+
+    Returns:
+        The case name.
+    """
+    return f"{structure} {workload} n={n}"
+
+
+def runSuite(ns=SUITE_N, seed=0):
+    """
+    Runs every workload of every structure for every n.
+
+    Args:
+        ns: Numbers of items.
+        seed: Seed of the random generators.
+
+    Returns:
+        A JSON-serializable report: the environment, and per case its time per operation
+        (and bytes per item for the memory workload).
+    """
+    results = {}
+    for n in ns:
+        for structure in STRUCTURES:
+            for workload in workloads(structure):
+                seconds, count, per_item = runWorkload(structure, workload, n, seed)
+                results[describe(structure, workload, n)] = {
+                    "seconds_per_operation": seconds / count, "bytes_per_item": per_item}
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def metric(result):
+    """
+    Returns the measurement compared against the baseline: the size for the memory
+    workload, the time per operation otherwise.
+
+    Args:
+        result: A result of `runSuite`.
+
+    Returns:
+        The measurement; lower is better.
+    """
+    if result["bytes_per_item"] is not None:
+        return result["bytes_per_item"]
+    return result["seconds_per_operation"]
+
+
+def main():
+    """
+    Entry point for the queue benchmark script: runs the suite, writes the JSON report
+    and compares it with a baseline.
+
+    Usage:
+        python QueueBenchmark.py output.json [baseline.json]
+    """
+    args = sys.argv[1:]
+    if len(args) not in (1, 2):
+        print('Usage: python QueueBenchmark.py output.json [baseline.json]')
+        return
+
+    report = runSuite()
+    with open(args[0], "w") as output:
+        json.dump(report, output, indent=2)
+
+    baseline = {}
+    if len(args) == 2:
+        with open(args[1]) as stored:
+            baseline = json.load(stored)["results"]
+
+    print(f"{'case':<50}{'ops/s':>14}{'bytes/item':>12}{'vs baseline':>13}")
+    regressions = 0
+    for case, result in report["results"].items():
+        per_item = "" if result["bytes_per_item"] is None else f"{result['bytes_per_item']:.1f}"
+        ratio = ""
+        if case in baseline:
+            ratio = metric(result) / metric(baseline[case])
+            regressions += ratio > 1 + REGRESSION_TOLERANCE
+            ratio = f"{ratio:.2f}x"
+        print(f"{case:<50}{1 / result['seconds_per_operation']:>14.0f}{per_item:>12}{ratio:>13}")
+
+    if regressions:
+        print(f"{regressions} case(s) worse than the baseline by more than {REGRESSION_TOLERANCE:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
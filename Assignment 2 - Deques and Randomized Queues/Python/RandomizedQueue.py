@@ -1,30 +1,101 @@
 """
 The `RandomizedQueue` class represents a queue where the item removed is chosen uniformly at random
-from items in the data structure. It uses a dynamic array (Python list) for efficient operations.
+from items in the data structure. It uses a dynamic array (Python list) for efficient operations,
+or a typed `array.array` for compact storage of numeric items.
 
 Usage:
 - Create a randomized queue: `random_queue = RandomizedQueue()`
+- Create a typed queue of 64-bit integers: `random_queue = RandomizedQueue(dtype='q')`
+- Create a typed queue that moves to disk past 10^7 items: `RandomizedQueue(dtype='q', spill=10**7)`
 - Add an item: `random_queue.enqueue(item)`
+- Add many items (from any iterable or buffer): `random_queue.extend(items)`
 - Remove a random item: `random_queue.dequeue()`
 - Sample a random item without removing: `random_queue.sample()`
+- Remove or sample k random items at once: `random_queue.dequeue_many(k)`, `random_queue.sample_many(k)`
 - Check if the queue is empty: `random_queue.is_empty()`
 - Get the number of items: `random_queue.size()`
 - Iterate over items in random order: `for item in random_queue.iterator(): ...`
 
 Note: The `RandomizedQueue` class ensures that each iterator returns the items in uniformly random order.
+Iterators shuffle lazily, one Fisher-Yates step per item, so creating one takes constant time.
+A spilled queue keeps its items in a memory-mapped file (see `MappedArray`) and works the same way.
 """
 
 
 import random
-from copy import deepcopy
+from array import array
+from itertools import islice
+from MappedArray import MappedArray
+
+# Buffer format characters of each kind of number, to match buffers against array typecodes
+_FORMAT_KINDS = ("bhilq", "BHILQ", "fd")
 
 class RandomizedQueue:
-    def __init__(self):
+    def __init__(self, dtype=None, spill=None, spill_dir=None):
         """
         Initializes an empty randomized queue.
+
+        Args:
+            dtype: None to store any objects in a list, or an `array` typecode (such as 'q'
+                for 64-bit integers or 'd' for doubles) to store numbers unboxed, using
+                itemsize bytes per item instead of a pointer plus a Python object.
+            spill: For a typed queue, the number of items above which the items move from
+                memory to a memory-mapped temporary file; None keeps them in memory.
+            spill_dir: Directory of the temporary file; None uses the system default.
+
+        Raises:
+            ValueError: If spill is given for an untyped queue.
         """
-        self.s = [] # Internal list to store elements
+        if spill is not None and dtype is None:
+            raise ValueError("Only typed queues (with a dtype) can spill to disk")
+
+        self.dtype = dtype
+        self.s = [] if dtype is None else array(dtype) # Internal list to store elements
         self.n = 0 # Number of elements in the queue
+        self.spill = spill # Size that triggers the move to disk, None once moved
+        self.spill_dir = spill_dir
+
+    class IteratorClass:
+        def __init__(self, items, n):
+            """
+            Initializes an iterator over the first n items in uniformly random order.
+
+            The items are not copied. The permutation is built lazily: only positions
+            displaced by earlier steps are stored, so startup is O(1) and reading k items
+            costs O(k) time and memory. The queue must not be modified during iteration.
+
+            Args:
+                items: The list of items to iterate over.
+                n: The number of items.
+            """
+            self.items = items
+            self.n = n
+            self.i = 0 # Number of items returned so far
+            self.moved = {} # Position -> index of the item placed there by an earlier swap
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            """
+            Returns the next item, chosen uniformly among the items not returned yet.
+
+            Raises:
+                StopIteration: When there are no more items to iterate.
+
+            Returns:
+                The next item.
+            """
+            if self.i >= self.n:
+                raise StopIteration
+
+            # Fisher-Yates step: swap position i with a random position j >= i
+            i = self.i
+            j = random.randint(i, self.n - 1)
+            index = self.moved.get(j, j)
+            self.moved[j] = self.moved.pop(i, i)
+            self.i += 1
+            return self.items[index]
 
     def is_empty(self):
         """
@@ -59,6 +130,111 @@ class RandomizedQueue:
 
         self.s.append(item)
         self.n += 1
+        if self.spill is not None and self.n > self.spill:
+            self._spill()
+
+    def extend(self, items):
+        """
+        Adds many items at once.
+
+        For a typed queue, a buffer of the same number type and size (an `array.array`,
+        a NumPy array, ...) or of raw bytes of packed numbers (`bytes`, `bytearray`) is
+        appended as one block of memory instead of item by item. Other items are converted
+        to the queue's type first, so if one of them does not fit, none is added.
+
+        A queue that can spill reads other iterables in chunks, moving to disk as soon as
+        the next chunk would pass the threshold, so a bulk load never holds much more than
+        `spill` items in memory.
+
+        Args:
+            items: An iterable of items, or a buffer for a typed queue.
+
+        Raises:
+            ValueError: If an item is None, or a buffer of raw bytes is not a whole
+                number of items.
+            TypeError: If an item does not fit the type of a typed queue.
+        """
+        if self.dtype is None:
+            items = list(items)
+            if any(item is None for item in items):
+                raise ValueError("Cannot enqueue None")
+            self.s.extend(items)
+            self.n = len(self.s)
+            return
+
+        start = len(self.s)
+        try:
+            if self._compatible(items):
+                view = memoryview(items).cast('B')
+                if self.spill is not None and start + len(view) // self.s.itemsize > self.spill:
+                    self._spill()
+                self.s.frombytes(view)
+                return
+
+            items = iter(items)
+            while self.spill is not None:
+                chunk = array(self.dtype, islice(items, MappedArray.CHUNK))
+                if not chunk:
+                    break
+                if len(self.s) + len(chunk) > self.spill:
+                    self._spill()
+                self.s.frombytes(memoryview(chunk).cast('B'))
+            if isinstance(self.s, MappedArray):
+                self.s.extend(items) # Writes the rest in chunks
+            else:
+                self.s.frombytes(memoryview(array(self.dtype, items)).cast('B'))
+        except BaseException:
+            del self.s[start:] # Drop the chunks already added
+            raise
+        finally:
+            self.n = len(self.s)
+
+    def _spill(self):
+        """
+        Moves the items from the in-memory array to a memory-mapped file, in one block copy.
+        Later operations, including the swap-with-last removal, work on the mapped records.
+        """
+        self.s = MappedArray(self.dtype, self.s, self.spill_dir)
+        self.spill = None
+
+    def close(self):
+        """
+        Deletes the file of a spilled queue; the queue must not be used afterwards.
+        Does nothing for a queue kept in memory.
+        """
+        if isinstance(self.s, MappedArray):
+            self.s.close()
+
+    def _compatible(self, items):
+        """
+        Checks whether items is a contiguous buffer with the same number type as the queue,
+        or raw bytes (`bytes`, `bytearray`) of packed items. Arrays of narrower numbers,
+        8-bit ones included, are not compatible and get converted item by item.
+
+        Args:
+            items: Any object.
+
+        Returns:
+            True if the raw bytes of items can be appended to the storage array.
+
+        Raises:
+            ValueError: If items are raw bytes that are not a whole number of items.
+        """
+        try:
+            view = memoryview(items)
+        except TypeError:
+            return False
+        if not view.c_contiguous:
+            return False
+
+        if isinstance(items, (bytes, bytearray)):
+            if view.nbytes % self.s.itemsize:
+                raise ValueError("bytes length not a multiple of item size")
+            return True
+
+        fmt = view.format.lstrip('@=')
+        same_kind = any(fmt in kind and self.dtype in kind for kind in _FORMAT_KINDS)
+        return same_kind and view.itemsize == self.s.itemsize
 
     def dequeue(self):
         """
@@ -94,14 +270,81 @@ class RandomizedQueue:
         index = random.randint(0, self.n - 1)
         return self.s[index]
 
+    def dequeue_many(self, k):
+        """
+        Removes and returns k random items in a single call.
+
+        The k positions are drawn together as a uniform random k-subset (in random order),
+        then removed in bulk: the holes they leave are filled with the unselected items
+        from the last k slots and the tail is cut off. Equivalent in distribution to k
+        calls to `dequeue()`.
+
+        Args:
+            k: The number of items to remove.
+
+        Returns:
+            A list of the k dequeued items.
+
+        Raises:
+            ValueError: If k is negative.
+            IndexError: If the queue holds fewer than k items.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        if k > self.n:
+            raise IndexError("Queue holds fewer than k items")
+
+        s, n = self.s, self.n
+        positions = random.sample(range(n), k)
+        items = [s[i] for i in positions]
+
+        # Fill the selected slots below the cut with the unselected items above it
+        cut = n - k
+        selected = set(positions)
+        holes = [i for i in positions if i < cut]
+        fillers = [j for j in range(cut, n) if j not in selected]
+        for i, j in zip(holes, fillers):
+            s[i] = s[j]
+        del s[cut:]
+        self.n = cut
+        return items
+
+    def sample_many(self, k, replace=True):
+        """
+        Returns k random items without removing them, in a single call.
+
+        Args:
+            k: The number of items to sample.
+            replace: If True, items are drawn independently (an item can appear more
+                than once); otherwise k distinct items are drawn.
+
+        Returns:
+            A list of the k sampled items.
+
+        Raises:
+            ValueError: If k is negative.
+            IndexError: If the queue is empty, or holds fewer than k items when
+                sampling without replacement.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        if k == 0:
+            return []
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+
+        if replace:
+            return random.choices(self.s, k=k)
+        if k > self.n:
+            raise IndexError("Queue holds fewer than k items")
+        return random.sample(self.s, k)
+
     def iterator(self):
         """
-        Returns an iterator over a shuffled copy of the elements in the randomized queue.
-        The original queue remains unchanged.
+        Returns an iterator over the elements in the randomized queue in uniformly random order.
+        The original queue remains unchanged; it must not be modified while iterating.
 
         Returns:
             An iterator.
         """
-        copy = deepcopy(self.s)
-        random.shuffle(copy)
-        return iter(copy)
\ No newline at end of file
+        return self.IteratorClass(self.s, self.n)
\ No newline at end of file
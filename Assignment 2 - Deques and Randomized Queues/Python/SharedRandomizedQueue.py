@@ -0,0 +1,173 @@
+"""
+The `SharedRandomizedQueue` class represents a randomized queue of numbers shared by several
+processes. The items live in a `multiprocessing.shared_memory` block, so workers attach to one
+queue and dequeue random items from it directly, without pickling the items or going through a
+manager process.
+
+Usage:
+- Create a queue for up to 10^6 64-bit integers: `jobs = SharedRandomizedQueue(10**6, dtype='q')`
+- Add items: `jobs.enqueue(item)`, `jobs.extend(items)`
+- Pass it to workers: `Process(target=work, args=(jobs,))` or
+  `Pool(initializer=init, initargs=(jobs,))`
+- In a worker: `item = jobs.dequeue()`, `jobs.sample()`, `jobs.size()`
+- Clean up: `jobs.close()` in every process, and `jobs.unlink()` once in the creator
+
+Note: The block starts with the size counter, followed by the items as fixed-size records. One
+`multiprocessing.Lock` guards the counter and the swap-with-last removal, so a dequeue is atomic
+across processes. Like any multiprocessing lock it can only be handed over when a process starts
+(in the Process arguments or a Pool initializer), not sent through a queue or a pipe later on.
+"""
+
+
+import random
+import multiprocessing
+from array import array
+from multiprocessing import shared_memory
+
+HEADER = 8  # Bytes before the items: the size counter, as a 64-bit integer
+
+class SharedRandomizedQueue:
+    def __init__(self, capacity, dtype='q', name=None, lock=None):
+        """
+        Creates a shared randomized queue, or attaches to an existing one by name.
+
+        Args:
+            capacity: The maximum number of items; shared memory cannot grow.
+            dtype: An `array` typecode, such as 'q' for 64-bit integers or 'd' for doubles.
+            name: The name of an existing queue's shared memory block to attach to;
+                None creates a new, empty queue.
+            lock: The lock of the existing queue when attaching. None creates a new lock in
+                the default start method; pass `context.Lock()` to share the queue with
+                processes of another multiprocessing context.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        self.dtype = dtype
+        self.itemsize = array(dtype).itemsize
+        self.lock = lock if lock is not None else multiprocessing.Lock()
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER + capacity * self.itemsize)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.header = self.shm.buf[:HEADER].cast('q') # header[0] is the number of items
+        self.s = self.shm.buf[HEADER:HEADER + capacity * self.itemsize].cast(dtype)
+        if name is None:
+            self.header[0] = 0
+
+    def __reduce__(self):
+        """
+        Pickles the queue as its name and lock, so a child process attaches to the same memory.
+        """
+        return (SharedRandomizedQueue, (self.capacity, self.dtype, self.shm.name, self.lock))
+
+    def is_empty(self):
+        """
+        Checks if the randomized queue is empty.
+
+        Returns:
+            True if empty, False otherwise.
+        """
+        return self.size() == 0
+
+    def size(self):
+        """
+        Returns the number of elements in the randomized queue (may change as soon as it is returned).
+
+        Returns:
+            Number of elements.
+        """
+        return self.header[0]
+
+    def enqueue(self, item):
+        """
+        Adds an item to the randomized queue.
+
+        Args:
+            item: The item to enqueue.
+
+        Raises:
+            ValueError: If the item is None.
+            IndexError: If the queue is full.
+        """
+        if item is None:
+            raise ValueError("Cannot enqueue None")
+
+        with self.lock:
+            n = self.header[0]
+            if n == self.capacity:
+                raise IndexError("Queue is full")
+            self.s[n] = item
+            self.header[0] = n + 1
+
+    def extend(self, items):
+        """
+        Adds many items at once, as one block copy under a single acquisition of the lock.
+
+        Args:
+            items: An iterable of numbers of the queue's type.
+
+        Raises:
+            IndexError: If the items do not fit; then none of them is added.
+        """
+        items = array(self.dtype, items)
+        with self.lock:
+            n = self.header[0]
+            if n + len(items) > self.capacity:
+                raise IndexError("Queue is full")
+            self.s[n:n + len(items)] = memoryview(items)
+            self.header[0] = n + len(items)
+
+    def dequeue(self):
+        """
+        Removes and returns a random item from the randomized queue.
+
+        Returns:
+            The dequeued item.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        with self.lock:
+            n = self.header[0]
+            if n == 0:
+                raise IndexError("Queue is empty")
+            index = random.randint(0, n - 1)
+            item = self.s[index]
+            self.s[index] = self.s[n - 1]
+            self.header[0] = n - 1
+        return item
+
+    def sample(self):
+        """
+        Returns a random item from the randomized queue without removing it.
+
+        Returns:
+            A randomly sampled item.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        with self.lock:
+            n = self.header[0]
+            if n == 0:
+                raise IndexError("Queue is empty")
+            return self.s[random.randint(0, n - 1)]
+
+    def close(self):
+        """
+        Detaches this process from the shared memory. The queue must not be used afterwards.
+        """
+        self.header.release()
+        self.s.release()
+        self.shm.close()
+
+    def unlink(self):
+        """
+        Frees the shared memory once every process has closed it. Call it once, in the creator.
+        """
+        self.shm.unlink()
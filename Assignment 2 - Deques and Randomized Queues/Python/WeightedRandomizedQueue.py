@@ -0,0 +1,278 @@
+"""
+The `WeightedRandomizedQueue` class represents a randomized queue where the item removed or sampled
+is chosen with probability proportional to its weight. The weights are kept in a Fenwick tree
+(binary indexed tree), so enqueue, dequeue, sample and weight updates all take O(log n) time.
+
+Usage:
+- Create a weighted randomized queue: `queue = WeightedRandomizedQueue()`
+- Add an item: `handle = queue.enqueue(item, weight)`
+- Change the weight of an item: `queue.update(handle, weight)`
+- Remove a random item: `queue.dequeue()`
+- Sample a random item without removing: `queue.sample()`
+- Freeze the current items for O(1) sampling: `sampler = queue.alias()`, then `sampler.sample()`
+
+Note: Removal uses the same swap-with-last trick as `RandomizedQueue`, so items move between slots;
+`enqueue` returns a handle that keeps identifying the item for `update`.
+"""
+
+
+import random
+
+class WeightedRandomizedQueue:
+    MIN_CAPACITY = 8  # Initial number of slots of the Fenwick tree
+
+    def __init__(self):
+        """
+        Initializes an empty weighted randomized queue.
+        """
+        self.items = [] # Item per slot
+        self.weights = [] # Weight per slot
+        self.handles = [] # Handle per slot
+        self.slot = {} # Handle -> slot
+        self.next_handle = 0
+        self.n = 0 # Number of elements in the queue
+        self._rebuild(self.MIN_CAPACITY)
+
+    def _rebuild(self, capacity):
+        """
+        Builds the Fenwick tree over the current weights in O(capacity) time.
+
+        Args:
+            capacity: The number of slots of the tree.
+        """
+        tree = [0.0] * (capacity + 1)
+        tree[1:self.n + 1] = self.weights
+        for i in range(1, capacity + 1):
+            # Pass every sum up, including from slots above n that only hold sums of their children
+            parent = i + (i & -i)
+            if parent <= capacity:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.step = 1 << (capacity.bit_length() - 1) # Highest power of two <= capacity
+
+    def _add(self, slot, delta):
+        """
+        Adds delta to the weight of a slot in the Fenwick tree.
+
+        Args:
+            slot: The slot (0-based).
+            delta: The change of weight.
+        """
+        tree = self.tree
+        i = slot + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _find(self, u):
+        """
+        Finds the slot where the running sum of the weights first exceeds u.
+
+        Args:
+            u: A value in [0, total weight).
+
+        Returns:
+            The slot (0-based).
+        """
+        tree = self.tree
+        position, step = 0, self.step
+        while step:
+            if position + step < len(tree) and tree[position + step] <= u:
+                position += step
+                u -= tree[position]
+            step >>= 1
+        return min(position, self.n - 1) # Guards against rounding errors at the very end
+
+    def _draw(self):
+        """
+        Draws a slot with probability proportional to its weight.
+
+        Returns:
+            The slot (0-based).
+
+        Raises:
+            IndexError: If the queue is empty or all weights are zero.
+        """
+        total = self.total_weight()
+        if self.is_empty() or total <= 0:
+            raise IndexError("Queue is empty" if self.is_empty() else "All weights are zero")
+        return self._find(random.random() * total)
+
+    def is_empty(self):
+        """
+        Checks if the queue is empty.
+
+        Returns:
+            True if empty, False otherwise.
+        """
+        return self.n == 0
+
+    def size(self):
+        """
+        Returns the number of elements in the queue.
+
+        Returns:
+            Number of elements.
+        """
+        return self.n
+
+    def total_weight(self):
+        """
+        Returns the sum of the weights of all elements.
+
+        Returns:
+            The total weight.
+        """
+        total, i = 0.0, self.n
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def enqueue(self, item, weight):
+        """
+        Adds an item with the given weight.
+
+        Args:
+            item: The item to enqueue.
+            weight: A non-negative weight.
+
+        Returns:
+            A handle identifying the item, for `update`.
+
+        Raises:
+            ValueError: If the item is None or the weight is negative.
+        """
+        if item is None:
+            raise ValueError("Cannot enqueue None")
+        if weight < 0:
+            raise ValueError("Weight must be non-negative")
+
+        if self.n == len(self.tree) - 1:
+            self._rebuild(2 * (len(self.tree) - 1))
+
+        handle = self.next_handle
+        self.next_handle += 1
+        self.items.append(item)
+        self.weights.append(weight)
+        self.handles.append(handle)
+        self.slot[handle] = self.n
+        self._add(self.n, weight)
+        self.n += 1
+        return handle
+
+    def dequeue(self):
+        """
+        Removes and returns an item chosen with probability proportional to its weight.
+
+        Returns:
+            The dequeued item.
+
+        Raises:
+            IndexError: If the queue is empty or all weights are zero.
+        """
+        slot = self._draw()
+        item = self.items[slot]
+        del self.slot[self.handles[slot]]
+
+        # Move the last element into the freed slot
+        last = self.n - 1
+        self._add(slot, self.weights[last] - self.weights[slot])
+        self._add(last, -self.weights[last])
+        if slot != last:
+            self.items[slot] = self.items[last]
+            self.weights[slot] = self.weights[last]
+            self.handles[slot] = self.handles[last]
+            self.slot[self.handles[slot]] = slot
+        self.items.pop()
+        self.weights.pop()
+        self.handles.pop()
+        self.n -= 1
+
+        capacity = len(self.tree) - 1
+        if capacity > self.MIN_CAPACITY and self.n <= capacity // 4:
+            self._rebuild(capacity // 2)
+        return item
+
+    def sample(self):
+        """
+        Returns an item chosen with probability proportional to its weight, without removing it.
+
+        Returns:
+            A randomly sampled item.
+
+        Raises:
+            IndexError: If the queue is empty or all weights are zero.
+        """
+        return self.items[self._draw()]
+
+    def update(self, handle, weight):
+        """
+        Changes the weight of an item.
+
+        Args:
+            handle: The handle returned by `enqueue`.
+            weight: The new non-negative weight.
+
+        Raises:
+            KeyError: If the handle does not identify an item in the queue.
+            ValueError: If the weight is negative.
+        """
+        if weight < 0:
+            raise ValueError("Weight must be non-negative")
+        slot = self.slot[handle]
+        self._add(slot, weight - self.weights[slot])
+        self.weights[slot] = weight
+
+    def alias(self):
+        """
+        Returns a static sampler over the current items and weights, for sample-only workloads.
+
+        Returns:
+            An `AliasSampler`, unaffected by later changes to the queue.
+        """
+        return AliasSampler(self.items, self.weights)
+
+
+class AliasSampler:
+    def __init__(self, items, weights):
+        """
+        Builds an alias table (Vose's method) over a fixed set of weighted items in O(n) time.
+
+        Args:
+            items: The items.
+            weights: A non-negative weight per item, not all zero.
+
+        Raises:
+            ValueError: If there are no items, the lengths differ or all weights are zero.
+        """
+        n = len(items)
+        total = sum(weights)
+        if n == 0 or n != len(weights) or total <= 0:
+            raise ValueError("Need at least one item with a positive weight and one weight per item")
+
+        self.items = list(items)
+        self.prob = [0.0] * n # Probability of keeping the drawn column
+        self.alias = list(range(n)) # Item that fills the rest of the column
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+        for i in small + large: # Leftovers are 1 up to rounding errors
+            self.prob[i] = 1.0
+
+    def sample(self):
+        """
+        Returns an item chosen with probability proportional to its weight, in O(1) time.
+
+        Returns:
+            A randomly sampled item.
+        """
+        i = random.randrange(len(self.items))
+        return self.items[i] if random.random() < self.prob[i] else self.items[self.alias[i]]
@@ -4,22 +4,22 @@ from copy import deepcopy
 
 class FastCollinearPoints:
     def __init__(self, points):
-    """
-    Initializes a FastCollinearPoints object with an array of points.
+        """
+        Initializes a FastCollinearPoints object with an array of points.
 
-    Args:
-        points (list[Point]): An array of points.
-    Raises:
-        ValueError: If the input array or any point in it is None.
-        ValueError: If any two points in the array are the same.
-    """
+        Args:
+            points (list[Point]): An array of points.
+        Raises:
+            ValueError: If the input array or any point in it is None.
+            ValueError: If any two points in the array are the same.
+        """
         if points is None:
             raise ValueError()
 
         n = len(points)
         clone = []
         self.segments = []
-		
+
         for i in range(n):
             if points[i] is None:
                 raise ValueError()
@@ -67,7 +67,7 @@ class FastCollinearPoints:
 # Example usage
 if __name__ == "__main__":
     points = [Point(10000, 0), Point(0, 10000), Point(3000, 7000), Point(7000, 3000), Point(20000, 21000),
-	      Point(3000, 4000), Point(14000, 15000), Point(6000, 7000)]
+              Point(3000, 4000), Point(14000, 15000), Point(6000, 7000)]
     
     lines = FastCollinearPoints(points)
     print(f"Number of segments found = {lines.number_of_segments()}")
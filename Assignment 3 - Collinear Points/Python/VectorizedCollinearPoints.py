@@ -0,0 +1,85 @@
+import numpy
+from Point import Point
+from LineSegment import LineSegment
+
+class VectorizedCollinearPoints:
+    def __init__(self, points):
+        """
+        Initializes a VectorizedCollinearPoints object with an array of points.
+
+        Finds the same segments as FastCollinearPoints (every maximal line through 4 or
+        more points), but keeps the coordinates in NumPy arrays: for each anchor point,
+        the slopes to all the other points are computed in one vectorized operation,
+        sorted with a stable argsort, and runs of equal slopes are found by comparing
+        neighbours of the sorted slopes. Requires NumPy.
+
+        Args:
+            points (list[Point]): An array of points.
+        Raises:
+            ValueError: If the input array or any point in it is None.
+            ValueError: If any two points in the array are the same.
+        """
+        if points is None or any(point is None for point in points):
+            raise ValueError()
+
+        # Sort by y-coordinate, breaking ties by x-coordinate (the order of Point.__lt__)
+        x = numpy.array([point.x for point in points], dtype=numpy.int64)
+        y = numpy.array([point.y for point in points], dtype=numpy.int64)
+        order = numpy.lexsort((x, y))
+        x, y = x[order], y[order]
+        points = [points[i] for i in order]
+        self.segments = []
+
+        n = len(points)
+        if n > 1 and numpy.any((x[1:] == x[:-1]) & (y[1:] == y[:-1])):
+            raise ValueError()
+
+        for p in range(n):
+            dx, dy = x - x[p], y - y[p]
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                slopes = numpy.where(dx == 0, numpy.inf, dy / dx)
+            slopes[p] = numpy.nan # Never equal to anything, so the anchor is in no run
+
+            # Stable sort keeps each run of equal slopes in (y, x) order
+            byslope = numpy.argsort(slopes, kind='stable')
+            sorted_slopes = slopes[byslope]
+            breaks = numpy.flatnonzero(sorted_slopes[1:] != sorted_slopes[:-1]) + 1
+            starts = numpy.concatenate(([0], breaks))
+            ends = numpy.concatenate((breaks, [n]))
+
+            # A run of 3 or more points is a segment with the anchor; it is reported only
+            # from its smallest point, so the anchor must come before every point of the run
+            found = (ends - starts >= 3) & (byslope[starts] > p)
+            for end in ends[found]:
+                self.segments.append(LineSegment(points[p], points[byslope[end - 1]]))
+
+    def number_of_segments(self):
+        """
+        Returns the number of line segments found.
+
+        Returns:
+            int: The number of line segments.
+        """
+        return len(self.segments)
+
+    def get_segments(self):
+        """
+        Returns an array of line segments found.
+
+        Returns:
+            list[LineSegment]: An array of line segments.
+        """
+        return self.segments
+
+
+# Example usage
+if __name__ == "__main__":
+    points = [Point(10000, 0), Point(0, 10000), Point(3000, 7000), Point(7000, 3000), Point(20000, 21000),
+              Point(3000, 4000), Point(14000, 15000), Point(6000, 7000)]
+
+    lines = VectorizedCollinearPoints(points)
+    print(f"Number of segments found = {lines.number_of_segments()}")
+
+    segments = lines.get_segments()
+    for segment in segments:
+        print(segment)